@@ -12,6 +12,11 @@ import math
 import numpy as np
 from typing import Callable, Tuple
 
+try:  # optional: compiles the tabulated p-y spring kernel when numba is installed
+  from numba import njit
+except ImportError:
+  njit = None
+
 def get_tz_curve(layer, pile_diameter, depth):
   """
   Build a shaft resistane (t-z) curve follwoing API RP 2GEO ideas.
@@ -148,6 +153,108 @@ def get_py_curve(layer, pile_diameter, depth):
       p = k_lin * y / 1000.0
   return y, p
 
+def get_tz_curve_batch(layers, pile_diameter, depths):
+  """
+  get_tz_curve for several layers at once.
+
+  layers: sequence of layer dicts
+  depths: depth of each layer's curve (m), same length as layers
+
+  Clay and sand curves have different point counts, so the math runs once per
+  soil type on stacked arrays. Returns a list of (z, t) array pairs in layer order.
+  """
+  depths = np.asarray(depths, dtype=np.float64)
+  out = [(np.empty(0), np.empty(0))] * len(layers)
+  types = [L["type"] for L in layers]
+
+  clay = [i for i, tp in enumerate(types) if tp == "clay"]
+  if clay:
+    gamma = np.array([layers[i]["gamma_kNpm3"] for i in clay], dtype=np.float64)
+    su = np.array([layers[i]["undrained_shear_strength_kPa"] for i in clay], dtype=np.float64)
+    sigma_v = gamma * depths[clay]
+    with np.errstate(divide="ignore", invalid="ignore"):
+      psi = su / sigma_v
+      alpha = np.where(psi <= 1, 0.5 * psi ** -0.5, 0.5 * psi ** -0.25)
+    alpha = np.where((sigma_v > 0) & (su > 0), np.minimum(alpha, 1.0), 1.0)
+    residual = 0.8
+    z = np.array([0, 0.0016, 0.0031, 0.0057, 0.0080, 0.0100, 0.0200, 0.1]) * pile_diameter
+    t = np.outer(alpha * su, [0, 0.3, 0.5, 0.75, 0.9, 1.0, residual, residual])
+    for row, i in enumerate(clay):
+      out[i] = (z, t[row])
+
+  sand = [i for i, tp in enumerate(types) if tp == "sand"]
+  if sand:
+    gamma = np.array([layers[i]["gamma_kNpm3"] for i in sand], dtype=np.float64)
+    phi_deg = np.array([layers[i]["phi_deg"] for i in sand], dtype=np.float64)
+    K = 0.8
+    t_max = K * gamma * depths[sand] * np.tan(np.radians(phi_deg - 5))
+    z = np.array([0, 0.00025, 0.001, 0.0025, 0.01, 0.025])
+    t = np.outer(t_max, [0.0, 0.10, 0.30, 0.50, 0.80, 1.00])
+    for row, i in enumerate(sand):
+      out[i] = (z, t[row])
+  return out
+
+def get_py_curve_batch(layers, pile_diameter, depths):
+  """
+  get_py_curve for several layers at once.
+
+  Every p-y curve shares the same 100-point y grid, so the result is
+  y (100,) and p (n_layers, 100); rows for unknown soil types stay zero.
+  """
+  def col(key, default=np.nan):
+    return np.array([default if L.get(key) is None else float(L.get(key)) for L in layers], dtype=np.float64)
+  types = [str(L.get("type", "")).strip().lower() for L in layers]
+  return get_py_curve_columns(types, col("gamma_kNpm3", 0.0), col("undrained_shear_strength_kPa"), col("phi_deg"), pile_diameter, depths)
+
+def get_py_curve_columns(types, gamma, su, phi_deg, pile_diameter, depths):
+  """
+  get_py_curve_batch on per-row columns (struct-of-arrays) instead of layer dicts.
+
+  types holds lower-case soil type names; gamma, su and phi_deg are float arrays
+  with one entry per row (entries not used by a row's soil type are ignored).
+  """
+  depths = np.asarray(depths, dtype=np.float64)
+  gamma_all = np.asarray(gamma, dtype=np.float64)
+  D = pile_diameter
+  y = np.linspace(0, 0.05 * D, 100)
+  p = np.zeros((len(types), y.size))
+
+  clay = [i for i, tp in enumerate(types) if tp == "clay"]
+  if clay:
+    su = np.asarray(su, dtype=np.float64)[clay]
+    su = np.where(su <= 0, 1.0, su)
+    epsilon50 = np.where(su < 24, 0.02, 0.005)
+    y_c = (2.5 * epsilon50 * D)[:, None]
+    J = 0.5
+    Pu = ((3 + J + gamma_all[clay] * depths[clay] / su) * su * D)[:, None]
+    p[clay] = np.where(y <= 8 * y_c, 0.5 * Pu * np.cbrt(y / y_c), Pu)
+
+  sand = [i for i, tp in enumerate(types) if tp == "sand"]
+  if sand:
+    phi_deg = np.asarray(phi_deg, dtype=np.float64)[sand]
+    phi = np.radians(phi_deg)
+    z = depths[sand]
+    sin_phi, tan_phi = np.sin(phi), np.tan(phi)
+    k_p = (1 + sin_phi) / (1 - sin_phi)
+    k_a = 1 / k_p
+    k0 = 0.4
+    alpha = phi / 2
+    beta = np.radians(45 + phi_deg / 2)
+    C1 = np.tan(beta) * (k_p * np.tan(alpha) + k0 * (tan_phi * np.sin(beta) * (1 / np.cos(alpha) + 1) - np.tan(alpha)))
+    C2 = k_p - k_a
+    C3 = 3 * k_p * k_p * np.sqrt(k_p + k0 * tan_phi) / np.sqrt(k_p)
+
+    gamma = gamma_all[sand]
+    gamma_prime = np.where(gamma > 9.81, gamma - 9.81, gamma)
+    Pu = np.minimum((C1 * z + C2 * D) * gamma_prime * z, C3 * D * gamma_prime * z)
+
+    k = 5.4 * phi_deg ** 1.5 / 1000
+    A = np.maximum(3 - 0.8 * z / D, 0.9)
+    with np.errstate(divide="ignore", invalid="ignore"):
+      slope = np.where(Pu != 0, k * z / Pu, 0.0)
+    p[sand] = (A * Pu)[:, None] * np.tanh(slope[:, None] * y)
+  return y, p
+
 def make_py_spring(py_backbone):
   """
   Wrap a p-y backbone p = f(y, z) into a function returning (p, dpdy).
@@ -171,3 +278,75 @@ def make_py_spring(py_backbone):
 
     return p, k
   return spring
+
+def _interp_rows(yq, y_grid, p_rows):
+  """
+  Row-wise np.interp: p_rows[i] evaluated at yq[i] on the shared ascending y_grid.
+  Queries outside the grid clamp to the end values, like np.interp.
+  """
+  yq = np.clip(yq, y_grid[0], y_grid[-1])
+  j = np.clip(np.searchsorted(y_grid, yq, side="right"), 1, y_grid.size - 1)
+  y0 = y_grid[j - 1]
+  w = (yq - y0) / (y_grid[j] - y0)
+  rows = np.arange(p_rows.shape[0])
+  lo = p_rows[rows, j - 1]
+  return lo + w * (p_rows[rows, j] - lo)
+
+def _row_interp(y_grid, p_rows, i, yq):
+  """p_rows[i] at yq on the ascending y_grid (clamped), by binary search."""
+  m = y_grid.shape[0]
+  yq = min(max(yq, y_grid[0]), y_grid[m - 1])
+  a, b = 0, m - 1
+  while b - a > 1:
+    c = (a + b) // 2
+    if y_grid[c] <= yq:
+      a = c
+    else:
+      b = c
+  w = (yq - y_grid[a]) / (y_grid[b] - y_grid[a])
+  return p_rows[i, a] + w * (p_rows[i, b] - p_rows[i, a])
+
+def _py_table_kernel(y, y_grid, p_rows):
+  """Single pass over the nodes: interpolated p and secant tangent, same rule as make_py_spring."""
+  n = y.shape[0]
+  p = np.empty(n)
+  k = np.empty(n)
+  for i in range(n):
+    ay = abs(y[i])
+    dy = 0.01 * ay if ay > 1e-6 else 1e-5
+    dy = min(max(dy, 1e-7), 1e-3)
+    p[i] = _row_interp(y_grid, p_rows, i, y[i])
+    ki = (_row_interp(y_grid, p_rows, i, y[i] + dy) - _row_interp(y_grid, p_rows, i, y[i] - dy)) / (2.0 * dy)
+    k[i] = ki if (np.isfinite(ki) and abs(ki) >= 1e-6) else 1e4
+  return p, k
+
+if njit is not None:
+  _row_interp = njit(cache=True)(_row_interp)
+  _py_table_kernel = njit(cache=True)(_py_table_kernel)
+
+def make_py_spring_table(y_grid, p_rows):
+  """
+  Vectorized counterpart of make_py_spring for tabulated backbones.
+
+  p_rows[i] is the p-y curve (N/m) of solver node i on y_grid (m). The returned
+  spring(y, z) takes the whole node vector y (z only fixes the node order) and
+  returns (p, dpdy) arrays with the same tangent rule as make_py_spring.
+  """
+  y_grid = np.asarray(y_grid, dtype=np.float64)
+  p_rows = np.asarray(p_rows, dtype=np.float64)
+
+  if njit is not None:
+    def spring(y, z):
+      return _py_table_kernel(np.ascontiguousarray(y, dtype=np.float64), y_grid, p_rows)
+    return spring
+
+  def spring(y, z):
+    y = np.asarray(y, dtype=np.float64)
+    ay = np.abs(y)
+    dy = np.clip(np.where(ay > 1e-6, 0.01 * ay, 1e-5), 1e-7, 1e-3)
+
+    p = _interp_rows(y, y_grid, p_rows)
+    k = (_interp_rows(y + dy, y_grid, p_rows) - _interp_rows(y - dy, y_grid, p_rows)) / (2.0 * dy)
+    k = np.where(np.isfinite(k) & (np.abs(k) >= 1e-6), k, 1e4)
+    return p, k
+  return spring
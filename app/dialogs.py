@@ -15,7 +15,6 @@ class PileDialog(QDialog):
     #Collect basic pile properties in SI units.
     def __init__(self, pile: dict | None, parent=None):
         super().__init__(parent)
-        print("Initializing PileDialog")  # Debug
         self.setWindowTitle("Edit Pile")
         lay = QFormLayout(self)
         
@@ -0,0 +1,150 @@
+"""
+PDF report writer shared by the axial and lateral exporters.
+
+Has no Qt dependency so the main window can run it on a worker thread.
+"""
+
+import io
+
+def figure_image(fig, dpi: int):
+  """
+  Rasterize a detached Matplotlib figure to an RGB PIL image.
+
+  Saves raw RGBA rather than PNG, so there is no encode/decode round trip.
+  Goes through savefig (not canvas.draw) so animated artists are drawn too.
+  """
+  from matplotlib.backends.backend_agg import FigureCanvasAgg
+  from PIL import Image
+
+  canvas = FigureCanvasAgg(fig)
+  fig.set_dpi(dpi)
+  buf = io.BytesIO()
+  fig.savefig(buf, format="rgba", dpi=dpi)
+  w, h = canvas.get_width_height()
+  return Image.frombuffer("RGBA", (w, h), buf.getbuffer(), "raw", "RGBA", 0, 1).convert("RGB")
+
+def _save_with_vector_figures(c, pdf_fh, path: str, figs, dpi: int, progress=None) -> bool:
+  """
+  Finish the ReportLab text page and append figs as vector PDF pages.
+
+  Axes, text and lines stay vector; only artists marked rasterized are
+  rendered as images, at dpi. progress is called as in render_pdf. Returns
+  False (and leaves the canvas untouched) when neither pypdf nor its
+  predecessor PyPDF2 is installed.
+  """
+  try:
+    from pypdf import PdfWriter
+  except ImportError:
+    try:
+      from PyPDF2 import PdfWriter
+    except ImportError:
+      return False
+  from matplotlib.backends.backend_pdf import PdfPages
+
+  c.showPage()
+  c.save()
+  pdf_fh.close()
+
+  fig_buf = io.BytesIO()
+  with PdfPages(fig_buf) as pp:
+    for idx, fig in enumerate(figs):
+      pp.savefig(fig, dpi=dpi)
+      fig.clf()
+      if progress is not None:
+        progress(idx + 1, len(figs))
+  fig_buf.seek(0)
+
+  writer = PdfWriter()
+  writer.append(path)
+  writer.append(fig_buf)
+  with open(path, "wb", buffering=1 << 20) as f:
+    writer.write(f)
+  return True
+
+def render_pdf(path: str, heading: str, lines: list[str], figs: list, images: list, empty_note: str, dpi: int = 150, progress=None) -> dict:
+  """
+  Write a report: heading and input summary on the first page, then one figure per page.
+
+  figs must not be attached to an on-screen canvas (the caller passes snapshots).
+  images lines up with figs and holds already-rendered PIL images or None.
+  progress, if given, is called as progress(done, total) after each figure page.
+  Returns {index: image} for the figures rasterized here so the caller can cache them.
+  """
+  from reportlab.lib.pagesizes import letter
+  from reportlab.lib.units import inch
+  from reportlab.lib.utils import ImageReader
+  from reportlab.pdfgen import canvas as rl_canvas
+
+  # Coalesce ReportLab's many small writes into 1 MiB chunks
+  pdf_fh = open(path, "wb", buffering=1 << 20)
+  c = rl_canvas.Canvas(pdf_fh, pagesize=letter)
+  width, height = letter
+  margin = 0.75 * inch
+  cursor_y = height - margin
+
+  # Header
+  c.setFont("Helvetica-Bold", 14)
+  c.drawString(margin, cursor_y, heading)
+  cursor_y -= 18
+
+  # Inputs summary, emitted as a single text object
+  t = c.beginText(margin, cursor_y)
+  t.setFont("Helvetica", 10, leading=12)
+  for txt in lines:
+    t.textLine(txt)
+  t.setTextOrigin(margin, t.getY() - 4)
+  t.textLine("Notes: Results generated from the project inputs listed above.")
+  c.drawText(t)
+  cursor_y = t.getY() - 10
+
+  rendered = {}
+  if not figs:
+    cursor_y -= 14
+    c.setFont("Helvetica-Oblique", 10)
+    c.drawString(margin, cursor_y, empty_note)
+    c.showPage()
+    c.save()
+    pdf_fh.close()
+    return rendered
+
+  # Vector figure pages when pypdf is installed; otherwise rasterize below
+  if _save_with_vector_figures(c, pdf_fh, path, figs, dpi, progress):
+    return rendered
+
+  # Layout: one figure per page (scaled to fit within margins)
+  max_plot_w = width - 2 * margin
+  max_plot_h = height - 2 * margin - 80
+  for idx, fig in enumerate(figs):
+    # Start a new page for each figure except the first
+    if idx > 0:
+      c.showPage()
+      cursor_y = height - margin
+      c.setFont("Helvetica-Bold", 14)
+      c.drawString(margin, cursor_y, heading)
+      cursor_y -= 24
+
+    img = images[idx]
+    if img is None:
+      img = rendered[idx] = figure_image(fig, dpi)
+
+    # Compute image aspect and scale to fit
+    iw, ih = fig.get_size_inches()
+    aspect = ih / iw
+    draw_w = max_plot_w
+    draw_h = draw_w * aspect
+    if draw_h > max_plot_h:
+      draw_h = max_plot_h
+      draw_w = draw_h / aspect
+
+    x = margin + (max_plot_w - draw_w) / 2.0
+    y = margin + (max_plot_h - draw_h) / 2.0
+    c.drawImage(ImageReader(img), x, y, width=draw_w, height=draw_h, preserveAspectRatio=True, anchor='c')
+    # figs are throwaway snapshots; drop their artists once the page is drawn
+    fig.clf()
+    if progress is not None:
+      progress(idx + 1, len(figs))
+
+  c.showPage()
+  c.save()
+  pdf_fh.close()
+  return rendered
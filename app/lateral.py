@@ -113,10 +113,14 @@ def lateral_analysis(
     pile: PileProps,
     load_steps: List[LateralLoadCase],
     py_spring: Callable[[float, float], Tuple[float, float]],
-    cfg: LateralConfig = LateralConfig()
+    cfg: LateralConfig = LateralConfig(),
+    py_spring_vec: Callable[[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]] | None = None
 ) -> Dict[str, object]:
   """
   solver for lateral response under increasing head load/moment using Newton iterations.
+
+  py_spring_vec, if given, evaluates (p, k) for all nodes in one call and is used
+  instead of calling py_spring node by node.
   """
   n = int(pile.n_nodes)
   L = float(pile.length_m)
@@ -125,6 +129,9 @@ def lateral_analysis(
   EI = float(pile.EI_Nm2)
 
   D2, D3, D4 = finite_diff_mats(n, dz)
+  # Invariant across every Newton iteration of every load step
+  EI_D4 = EI * D4
+  reg = (1e-9 * EI) * np.eye(n)
 
   # State across Load steps
   y_prev = 1e-6 * np.exp(-z / max(1e-9, 0.2 * L))
@@ -138,17 +145,20 @@ def lateral_analysis(
 
     for _ in range(cfg.max_iters):
       # Soil reaction and tangent at current y
-      p = np.zeros(n)
-      k = np.zeros(n)
-      for i in range(n):
-        p[i], k[i] = py_spring(y[i], z[i])
+      if py_spring_vec is not None:
+        p, k = py_spring_vec(y, z)
+      else:
+        p = np.zeros(n)
+        k = np.zeros(n)
+        for i in range(n):
+          p[i], k[i] = py_spring(y[i], z[i])
       p = np.nan_to_num(p, nan=0.0, posinf=0.0, neginf=0.0)
       k = np.nan_to_num(k, nan=1e5, posinf=1e9, neginf=1e5)
-      k = np.clip(k, 1e3, 1e9)
+      np.clip(k, 1e3, 1e9, out=k)
 
       # Newton system: (EI*D4 - diag(k)) dy = p - EI*D4*y
-      A = EI * D4 - np.diag(k)
-      r = p - EI * (D4 @ y) 
+      A = EI_D4 - np.diag(k)
+      r = p - EI_D4 @ y
 
       # Boundary conditions
       rhs_bc = apply_boundary_conditions(D2, D3, A, y, pile, cfg, lc, EI, dz)
@@ -175,9 +185,10 @@ def lateral_analysis(
             A[1, :] = EI * D2row0
             r[1] = float(lc.M_Nm - EI * (D2row0 @ y))
 
-      A = np.nan_to_num (A, nan=0.0, posinf=0.0, neginf=0.0)
-      r = np.nan_to_num(r, nan=0.0, posinf=0.0, neginf=0.0)
-      A += (1e-9 * EI) * np.eye(n)      
+      # A and r are rebuilt every iteration, so sanitize them in place
+      np.nan_to_num(A, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+      np.nan_to_num(r, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+      A += reg
 
       # Solver for increment
       try:
@@ -219,7 +230,10 @@ def lateral_analysis(
     yppp = D3 @ y
     M = EI * ypp
     V = EI * yppp
-    p_out = np.array([py_spring(y[i], z[i])[0] for i in range(n)])
+    if py_spring_vec is not None:
+      p_out = py_spring_vec(y, z)[0]
+    else:
+      p_out = np.array([py_spring(y[i], z[i])[0] for i in range(n)])
 
     res = LateralResults(
       z_m=z, y_m=y, theta_rad=theta, M_Nm=M, V_N=V, p_N_per_m=p_out,
@@ -236,6 +250,22 @@ def lateral_analysis(
     "meta": {"EI_Nm2": EI, "length_m": L, "n_nodes": n}
   }
 
+def lateral_analysis_batch(
+    pile: PileProps,
+    H_N: np.ndarray,
+    M_Nm: float,
+    py_spring: Callable[[float, float], Tuple[float, float]],
+    cfg: LateralConfig = LateralConfig(),
+    py_spring_vec: Callable[[np.ndarray, np.ndarray], Tuple[np.ndarray, np.ndarray]] | None = None
+) -> Dict[str, object]:
+  """
+  Sweep the head shear values H_N (N) at a constant head moment M_Nm (N·m).
+
+  Each step warm-starts from the previous deflection; see lateral_analysis.
+  """
+  steps = [LateralLoadCase(H_N=h, M_Nm=float(M_Nm)) for h in np.asarray(H_N, dtype=float).tolist()]
+  return lateral_analysis(pile, steps, py_spring, cfg, py_spring_vec=py_spring_vec)
+
 def run_lateral_analysis(params: dict) -> dict:
   """
   Single public entry point for lateral pile analysis.
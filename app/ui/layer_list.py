@@ -0,0 +1,94 @@
+"""
+Soil layer list for the left dock.
+
+One model row per layer; the Edit/Delete buttons are painted by the delegate
+rather than built as child widgets, so the list costs nothing per layer.
+"""
+
+from PySide6.QtWidgets import QStyledItemDelegate, QStyle
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QEvent, QRect, QSize, Signal
+
+
+class SoilLayerModel(QAbstractListModel):
+  """Read-only list model over project["soil_profile"] (held by reference)."""
+
+  def __init__(self, parent=None):
+      super().__init__(parent)
+      self._layers = []
+
+  def set_layers(self, layers):
+      self.beginResetModel()
+      self._layers = layers if layers is not None else []
+      self.endResetModel()
+
+  def rowCount(self, parent=QModelIndex()):
+      if parent.isValid():
+          return 0
+      # a single disabled placeholder row when the profile is empty
+      return max(1, len(self._layers))
+
+  def data(self, index, role=Qt.DisplayRole):
+      if not index.isValid() or role != Qt.DisplayRole:
+          return None
+      if not self._layers:
+          return "(no soil layers)"
+      layer = self._layers[index.row()]
+      typ = (layer.get("type") or "soil").title()
+      z0 = layer.get("from_m", 0)
+      z1 = layer.get("to_m", 0)
+      return f"{index.row()+1}. {typ} ({z0:g}-{z1:g} m)"
+
+  def flags(self, index):
+      return Qt.ItemIsEnabled if self._layers else Qt.NoItemFlags
+
+
+class SoilLayerDelegate(QStyledItemDelegate):
+  """Paints a layer label with Edit/Delete pseudo-buttons and hit-tests clicks on them."""
+
+  editRequested = Signal(int)
+  deleteRequested = Signal(int)
+
+  _BUTTONS = ("Edit", "Delete")
+
+  def _button_rects(self, option) -> list[QRect]:
+      fm = option.fontMetrics
+      r = option.rect.adjusted(6, 2, -6, -2)
+      rects = []
+      right = r.right()
+      for text in reversed(self._BUTTONS):
+          w = fm.horizontalAdvance(text) + 12
+          rects.insert(0, QRect(right - w + 1, r.top(), w, r.height()))
+          right -= w + 6
+      return rects
+
+  def paint(self, painter, option, index):
+      painter.save()
+      if option.state & QStyle.State_MouseOver and index.flags() & Qt.ItemIsEnabled:
+          painter.fillRect(option.rect, option.palette.alternateBase())
+
+      rects = self._button_rects(option) if index.flags() & Qt.ItemIsEnabled else []
+      text_rect = option.rect.adjusted(6, 0, -6, 0)
+      if rects:
+          text_rect.setRight(rects[0].left() - 6)
+      painter.setPen(option.palette.text().color())
+      painter.drawText(text_rect, Qt.AlignVCenter | Qt.AlignLeft, index.data() or "")
+
+      for rect, text in zip(rects, self._BUTTONS):
+          painter.setPen(option.palette.mid().color())
+          painter.drawRoundedRect(rect, 3, 3)
+          painter.setPen(option.palette.buttonText().color())
+          painter.drawText(rect, Qt.AlignCenter, text)
+      painter.restore()
+
+  def sizeHint(self, option, index):
+      fm = option.fontMetrics
+      return QSize(fm.horizontalAdvance(index.data() or "") + 140, fm.height() + 10)
+
+  def editorEvent(self, event, model, option, index):
+      if event.type() == QEvent.MouseButtonRelease and index.flags() & Qt.ItemIsEnabled:
+          pos = event.position().toPoint()
+          for rect, signal in zip(self._button_rects(option), (self.editRequested, self.deleteRequested)):
+              if rect.contains(pos):
+                  signal.emit(index.row())
+                  return True
+      return super().editorEvent(event, model, option, index)
@@ -9,37 +9,230 @@ This wires together:
 """
 
 import pathlib, io
+import logging
+import pickle
+import weakref
+from bisect import insort
+from functools import partial
+from importlib.util import find_spec
+from types import MappingProxyType
+from math import pi
 import numpy as np
-import matplotlib.pyplot as plt
 import matplotlib as mpl
-import pandas as pd
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backend_bases import FigureCanvasBase
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas, NavigationToolbar2QT as NavigationToolbar
 from matplotlib.ticker import MaxNLocator, FormatStrFormatter
 from matplotlib.lines import Line2D
 import matplotlib.patches as mpatches
-from mpl_toolkits.mplot3d import Axes3D
-from PySide6.QtWidgets import (QApplication, QMainWindow, QMenu, QHBoxLayout, QWidget, QVBoxLayout, QLabel, QPushButton, QFileDialog, QMessageBox, QStatusBar, QTextEdit, QTabWidget, QToolBar, QDockWidget, QListWidget, QListWidgetItem, QFrame, QDoubleSpinBox, QFormLayout, QToolButton, QStyle, QTextBrowser, QDialog)
-from PySide6.QtCore import Qt, QPoint, QSize, QSettings, QPropertyAnimation, QEasingCurve, QUrl
+from PySide6.QtWidgets import (QApplication, QMainWindow, QMenu, QHBoxLayout, QWidget, QVBoxLayout, QLabel, QPushButton, QFileDialog, QMessageBox, QStatusBar, QTextEdit, QTabWidget, QToolBar, QDockWidget, QListWidget, QListView, QFrame, QDoubleSpinBox, QFormLayout, QToolButton, QStyle, QTextBrowser, QDialog)
+from PySide6.QtCore import Qt, QPoint, QSize, QSettings, QPropertyAnimation, QEasingCurve, QUrl, QTimer, QObject, QEvent, QRunnable, QThreadPool, QSignalBlocker, Signal, Slot
 from PySide6.QtGui import QAction, QKeySequence, QIcon
-from ..curves import get_tz_curve, get_qz_curve, get_py_curve, make_py_spring
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.units import inch
-from reportlab.lib.utils import ImageReader
-from reportlab.pdfgen import canvas as rl_canvas
+from ..curves import get_qz_curve, get_tz_curve_batch, get_py_curve_batch, get_py_curve_columns, make_py_spring, make_py_spring_table
 from ..axial import axial_analysis
-from ..lateral import PileProps as LatPileProps, LateralLoadCase, BCType, LateralConfig, lateral_analysis
+from ..lateral import PileProps as LatPileProps, BCType, LateralConfig, lateral_analysis_batch
 
 # relative imports within the package
 from ..dialogs import PileDialog, LoadDialog, SoilLayerDialog
 from ..serializer import load_project, save_project
+from ..io.pdf_report import render_pdf
+from .layer_list import SoilLayerModel, SoilLayerDelegate
 
 from app.core.models import AxialInputs, LateralInputs
 from app.core.axial_engine import run_axial
 from app.core.lateral_engine import run_lateral
 
+log = logging.getLogger(__name__)
+
+# Matplotlib look used in both UI themes
+_MPL_LIGHT_PARAMS = MappingProxyType({
+    "figure.facecolor": "white",
+    "axes.facecolor": "white",
+    "savefig.facecolor": "white",
+    "axes.edgecolor": "black",
+    "axes.labelcolor": "black",
+    "xtick.color": "black",
+    "ytick.color": "black",
+    "grid.color": "#CCCCCC",
+    "axes.grid": True,
+})
+_mpl_light_applied = False
+
+def _apply_mpl_light():
+  """Matplotlib is always light; reset rc to the light params once per process."""
+  global _mpl_light_applied
+  if not _mpl_light_applied:
+    mpl.rcParams.update(mpl.rcParamsDefault)
+    mpl.style.use("default")
+    mpl.rcParams.update(_MPL_LIGHT_PARAMS)
+    _mpl_light_applied = True
+
+def _as_f64_view(x) -> np.ndarray:
+  """Flat float64 view of x; only copies when a dtype conversion is needed."""
+  a = np.asarray(x, dtype=np.float64)
+  return a if a.ndim == 1 else a.reshape(-1)
+
+def _set_checked_quiet(act, state: bool):
+  """Sync a checkable action without emitting toggled; no-op when already in that state."""
+  if act is None or act.isChecked() == state:
+    return
+  act.blockSignals(True)
+  act.setChecked(state)
+  act.blockSignals(False)
+
+def _soil_soa(layers) -> dict:
+  """Column (struct-of-arrays) view of soil_profile; missing numeric fields become NaN."""
+  def col(key):
+    vals = (L.get(key) for L in layers)
+    return np.fromiter((np.nan if v is None else float(v) for v in vals), dtype=np.float64, count=len(layers))
+  return {
+      "from_m": col("from_m"),
+      "to_m": col("to_m"),
+      "gamma_kNpm3": col("gamma_kNpm3"),
+      "phi_deg": col("phi_deg"),
+      "undrained_shear_strength_kPa": col("undrained_shear_strength_kPa"),
+      "type": np.array([L.get("type") for L in layers], dtype=object),
+  }
+
+def _layer_top(layer: dict) -> float:
+  """Sort key of soil_profile (ordered by start depth)."""
+  return layer.get("from_m", 0.0)
+
+def _profile_key(layers) -> tuple:
+  """Hashable snapshot of the soil profile fields shown in the summary and layer list."""
+  return tuple(
+      (L.get("type"), L.get("from_m"), L.get("to_m"), L.get("gamma_kNpm3"),
+       L.get("undrained_shear_strength_kPa"), L.get("phi_deg"))
+      for L in layers
+  )
+
+def _agg_figure(figsize=(6, 4)) -> Figure:
+  """Off-screen figure for report export, bound to a plain Agg canvas (no Qt widget)."""
+  fig = Figure(figsize=figsize, constrained_layout=True)
+  FigureCanvasAgg(fig)
+  return fig
+
+def _circular_EI(D: float, E: float) -> tuple[float, float]:
+  """(I, EI) of a solid circular section: I = pi D^4 / 64."""
+  I = pi * D * D * D * D / 64.0
+  return I, E * I
+
+def _interp_uniform(xq: np.ndarray, x0: float, dx: float, fp: np.ndarray) -> np.ndarray:
+  """np.interp(xq, x0 + dx*arange(len(fp)), fp) for an evenly spaced grid (dx > 0)."""
+  u = np.clip((xq - x0) / dx, 0.0, fp.size - 1)
+  i = np.minimum(u.astype(np.intp), fp.size - 2)
+  frac = u - i
+  return fp[i] + frac * (fp[i + 1] - fp[i])
+
+def _gradient_into(a: np.ndarray, dz: float, out: np.ndarray) -> np.ndarray:
+  """np.gradient(a, dz) for uniform spacing, written into out."""
+  np.subtract(a[2:], a[:-2], out=out[1:-1])
+  out[1:-1] *= 0.5 / dz
+  out[0] = (a[1] - a[0]) / dz
+  out[-1] = (a[-1] - a[-2]) / dz
+  return out
+
+def _moment_shear(y: np.ndarray, dz: float, EI: float):
+  """M = -EI y'' and V = dM/dz from deflections, using only the two output buffers."""
+  M = np.empty_like(y)
+  V = np.empty_like(y)
+  _gradient_into(y, dz, V)   # V holds the slope for now
+  _gradient_into(V, dz, M)
+  M *= -EI
+  _gradient_into(M, dz, V)
+  return M, V
+
+class _LazyCanvas(FigureCanvas):
+  """Qt canvas that defers Agg rendering while it sits in a hidden tab."""
+  # Set while the inspector dock animates; every frame resizes the plots
+  frozen = False
+
+  def __init__(self, figure=None):
+    self._agg_dirty = True
+    super().__init__(figure)
+
+  def draw(self):
+    if _LazyCanvas.frozen or not self.isVisible():
+      # Resizes and data updates on a hidden tab just mark the buffer stale
+      self._agg_dirty = True
+      return
+    super().draw()
+    self._agg_dirty = False
+
+  def showEvent(self, event):
+    super().showEvent(event)
+    if self._agg_dirty:
+      self.draw_idle()
+
+  def print_figure(self, *args, **kwargs):
+    # Vector saves draw through a temporary canvas that is not flagged as saving, which would
+    # leave blitted (animated) artists out of the file; draw them normally for the save
+    animated = self.figure.findobj(lambda a: a.get_animated())
+    for artist in animated:
+      artist.set_animated(False)
+    try:
+      return super().print_figure(*args, **kwargs)
+    finally:
+      for artist in animated:
+        artist.set_animated(True)
+      # The save replaced the Agg renderer at its own dpi; any saved blit background is stale
+      self._agg_dirty = True
+
+class _LazyToolbar(QWidget):
+  """Toolbar slot that builds the NavigationToolbar on first hover or when its canvas takes focus."""
+  def __init__(self, canvas, parent=None):
+    super().__init__(parent)
+    self._canvas = canvas
+    self.toolbar = None
+    lay = QVBoxLayout(self)
+    lay.setContentsMargins(0, 0, 0, 0)
+    self.setMinimumHeight(32)
+    canvas.installEventFilter(self)
+
+  def materialize(self):
+    if self.toolbar is None:
+      self._canvas.removeEventFilter(self)
+      self.toolbar = NavigationToolbar(self._canvas, self)
+      self.layout().addWidget(self.toolbar)
+      self.setMinimumHeight(0)
+    return self.toolbar
+
+  def enterEvent(self, event):
+    self.materialize()
+    super().enterEvent(event)
+
+  def eventFilter(self, obj, event):
+    # Keyboard pan/zoom shortcuts go through canvas.toolbar, so build it before keys arrive
+    if event.type() == QEvent.FocusIn:
+      self.materialize()
+    return False
+
+class _ExportSignals(QObject):
+  finished = Signal(object, object)
+  failed = Signal(object, str)
+  progress = Signal(int, int)
+
+class _PdfExportTask(QRunnable):
+  """Runs a report-writing callable on the thread pool and reports back via signals."""
+  def __init__(self, job):
+    super().__init__()
+    self.job = job
+    self.signals = _ExportSignals()
+
+  def run(self):
+    try:
+      payload = self.job()
+    except Exception as e:
+      self.signals.failed.emit(self, str(e))
+      return
+    self.signals.finished.emit(self, payload)
+
 class MainWindow(QMainWindow):
   def __init__(self):
     super().__init__()
+    # One settings handle for the window's lifetime
+    self._settings = QSettings("Pile Analysis", "StudentEdition")
     self.setWindowTitle("Pile Analysis Tool")
     self.setWindowIcon(QIcon("icons/app_icon.png"))
     self.resize(1200, 800)
@@ -48,6 +241,28 @@ class MainWindow(QMainWindow):
     self.project: dict | None = None
     self.last_axial_results = None
 
+    # Recent files are read from QSettings on first use and kept in memory
+    self._recent_cache: list[str] | None = None
+    self._recent_dirty = False
+    self._refreshing = False
+
+    # Widgets/actions created later by _make_welcome and _build_menu
+    self._welcome_recent = None
+    self._rebuild_recent_menu = None
+    self._dock = None
+    self._dock_title_label = None
+    self._dock_toggle_btn = None
+    self.recent_list = None
+    self.layers_list = None
+    self.actLight = None
+    self.actDark = None
+    self.actBCFree = None
+    self.actBCFixed = None
+
+    # Dock toggle arrows, created once instead of on every collapse/expand
+    self._icon_left = self.style().standardIcon(QStyle.StandardPixmap.SP_ArrowLeft)
+    self._icon_right = self.style().standardIcon(QStyle.StandardPixmap.SP_ArrowRight)
+
     #-------central area------
     central = QWidget()
     self.setCentralWidget(central)
@@ -75,6 +290,9 @@ class MainWindow(QMainWindow):
     self.plot_area = QTabWidget()
     self.plot_area.setTabsClosable(True)
     self.plot_area.tabCloseRequested.connect(self._close_plot_tab)
+    self.plot_area.currentChanged.connect(self._on_plot_tab_changed)
+    # Tabs whose canvas/toolbar is built on first display: tab -> (figure, fill(tab, fig))
+    self._pending_tabs = {}
     self.layout.addWidget(self.info)
     self.layout.addWidget(self.plot_area)
 
@@ -110,10 +328,37 @@ class MainWindow(QMainWindow):
     self._axial_figures = []
 
     self._lateral_figures = []
+    # Cleared figures from closed plot tabs, reused by generate_curves and run_axial_analysis
+    self._fig_pool: list[Figure] = []
     self.last_lateral_out = None
+    self.last_lateral_arrays = None
+    self._lateral_steps_cache = {}
+    # Curve preview tabs from generate_curves, keyed by (kind, layer index)
+    self._curve_cache = {}
+    # Pending preview tabs, added one per event-loop tick; the counter cancels stale batches
+    self._curve_specs = iter(())
+    self._curve_gen = 0
+    # Column view of soil_profile, rebuilt whenever the layer list changes
+    self._layers_soa = _soil_soa([])
+    self._ei_cache = None
+    # Load-Settlement tab reused across axial runs, plus its blit background
+    self._ls_plot = None
+    self._ls_bg = None
+
+    # Rendered raster image per figure, reused by the PDF exporters
+    self._img_cache = weakref.WeakKeyDictionary()
+    # (lateral output, figures) synthesized by export_lateral_pdf when no result tabs are open
+    self._lateral_pdf_figs = None
+    # Last inputs rendered into the summary / layer list (skip unchanged refreshes)
+    self._summary_key = None
+    self._last_html = None
+    self._layers_key = None
+    self._refresh_pending = False
+    # PDF exports in flight (kept alive until their finished/failed slot runs)
+    self._pdf_tasks = set()
 
     # Restore window geometry and dock/toolbar layout
-    s = QSettings("Pile Analysis", "StudentEdition")
+    s = self._settings
 
     g = s.value("win/geo")
     st = s.value("win/state")
@@ -123,9 +368,9 @@ class MainWindow(QMainWindow):
         if st:
             self.restoreState(st, 1)
     except Exception as e:
-        print("restoreState/restoreGeometry failed, using default layout:", e)
+        log.warning("restoreState/restoreGeometry failed, using default layout: %s", e)
     
-    if hasattr(self, "_dock"):
+    if self._dock is not None:
         self._dock.show()
         self._dock.raise_()
     
@@ -136,6 +381,12 @@ class MainWindow(QMainWindow):
     self._3d_fig = None
     self._3d_ax = None
     self._3d_scale_spin = None
+    self._3d_debounce = None
+    self._3d_grid = None            # (X, Y, Z, z_line) of the undeformed cylinder
+    self._3d_defl = None            # (z_m, y_m) of the last lateral step, or None
+    self._3d_defl_artists = []
+    self._3d_legend_base = []
+    self._3d_dirty = True           # scene inputs changed since the last _refresh_3d_view
 
   #---------Menus---------
   def _build_menu(self):
@@ -163,12 +414,16 @@ class MainWindow(QMainWindow):
       act_save.triggered.connect(self.save_project)
       tb.addAction(act_save); m_file.addAction(act_save)
 
-      # Recent submenu
+      # Recent submenu: a fixed set of actions, relabelled in place when the list changes
       self._m_recent = m_file.addMenu("Open &Recent")
-      self._rebuild_recent_menu = lambda: (
-          self._m_recent.clear(),
-          [self._m_recent.addAction(pathlib.Path(p).name, lambda p=p: self._open_path(p)) for p in self._recent_files()]
-      )
+      self._recent_actions = []
+      for _ in range(10):
+          act = QAction(self)
+          act.triggered.connect(lambda checked=False, a=act: self._open_path(a.data()))
+          act.setVisible(False)
+          self._m_recent.addAction(act)
+          self._recent_actions.append(act)
+      self._rebuild_recent_menu = self._sync_recent_actions
       self._rebuild_recent_menu()
       m_file.addSeparator()
 
@@ -294,7 +549,7 @@ class MainWindow(QMainWindow):
       btn_toggle.setToolTip("Hide/Show Project Inspector")
       btn_toggle.setAutoRaise(True)
 
-      btn_toggle.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_ArrowLeft))
+      btn_toggle.setIcon(self._icon_left)
 
       btn_toggle.setFixedSize(30, 30)
       btn_toggle.setIconSize(QSize(14, 14))
@@ -353,7 +608,16 @@ class MainWindow(QMainWindow):
       lbl_layers.setStyleSheet("margin-top: 8px; font-weight: 600;")
       dlay.addWidget(lbl_layers)
 
-      self.layers_list = QListWidget()
+      # Model/delegate list: Edit/Delete are painted, not one widget row per layer
+      self._layers_model = SoilLayerModel(self)
+      layers_delegate = SoilLayerDelegate(self)
+      layers_delegate.editRequested.connect(self.edit_soil_layer, Qt.QueuedConnection)
+      layers_delegate.deleteRequested.connect(self.delete_soil_layer, Qt.QueuedConnection)
+      self.layers_list = QListView()
+      self.layers_list.setModel(self._layers_model)
+      self.layers_list.setItemDelegate(layers_delegate)
+      self.layers_list.setUniformItemSizes(True)
+      self.layers_list.setMouseTracking(True)
       self.layers_list.setMaximumHeight(220)
       self.layers_list.setSpacing(2)
       dlay.addWidget(self.layers_list)
@@ -533,8 +797,7 @@ class MainWindow(QMainWindow):
       rec = QListWidget()
       rec.setMaximumHeight(160)
       self._welcome_recent = rec
-      for p in self._recent_files():
-          QListWidgetItem(p, rec)
+      rec.addItems(self._recent_files())
       rec.itemDoubleClicked.connect(lambda it: self._open_path(it.text()))
 
       lay.addStretch(1)
@@ -546,21 +809,29 @@ class MainWindow(QMainWindow):
       lay.addStretch(3)
       return w
   
+  def _sync_recent_actions(self):
+      files = self._recent_files()
+      for i, act in enumerate(self._recent_actions):
+          if i < len(files):
+              act.setText(pathlib.Path(files[i]).name)
+              act.setData(files[i])
+              act.setVisible(True)
+          else:
+              act.setVisible(False)
+
   def _refresh_recent_list(self):
       files = self._recent_files()
 
-      # Left dock list
-      if hasattr(self, "recent_list"):
-        self.recent_list.clear()
-        for p in files:
-            QListWidgetItem(p, self.recent_list)
-    
-      # Welcome screen list
-      if hasattr(self, "_welcome_recent"):
-        self._welcome_recent.clear()
-        for p in files:
-          QListWidgetItem(p, self._welcome_recent)
+      # Left dock list and welcome screen list, each filled with one batched insert
+      for lst in (self.recent_list, self._welcome_recent):
+        if lst is None:
+          continue
+        lst.setUpdatesEnabled(False)
+        lst.clear()
+        lst.addItems(files)
+        lst.setUpdatesEnabled(True)
 
+  @Slot()
   def new_project(self):
         #Minimal schema we will expand later
         self.project = {
@@ -571,11 +842,13 @@ class MainWindow(QMainWindow):
           "analysis": {"segments": 40, "lateral_bc": "free_head"}
         }
         self.last_axial_results = None
-        self.plot_area.clear()
+        self._rebuild_soa()
+        self._clear_plot_tabs()
         self.statusBar().showMessage("New Project created", 3000)
         self.refresh_ui()
         self._set_dirty(True)
 
+  @Slot()
   def open_project(self):
         fn, _ = QFileDialog.getOpenFileName(
           self, "Open Project", ".", "RSPile (*.pile.json);;All files (*)"
@@ -584,14 +857,11 @@ class MainWindow(QMainWindow):
           return
         try:
           self.project = load_project(fn)
-          self.statusBar().showMessage(f"Loaded {pathlib.Path(fn).name}", 3000)
-          self.refresh_ui()
-          self._sync_lateral_bc_checks()
-          self._set_dirty(False)
-          self._push_recent_file(fn)
+          self._post_load_refresh(fn)
         except Exception as e:
           QMessageBox.critical(self, "Open Failed", f"could not open file.\n\n{e}")
         
+  @Slot()
   def save_project(self):
           if self.project is None:
             QMessageBox.warning(self, "No Project", "Create or open a project first.")
@@ -610,36 +880,62 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Save Failed", f"Could not save file.\n\n{e}")
 
   def _recent_files(self) -> list[str]:
-      s = QSettings("Pile Analysis", "StudentEdition")
-      return s.value("recent_files", [], list)
+      if self._recent_cache is None:
+          self._recent_cache = self._settings.value("recent_files", [], list)
+      return self._recent_cache
   
   def _push_recent_file(self, path: str) -> None:
-      s = QSettings("Pile Analysis", "StudentEdition")
-      items = [p for p in self._recent_files() if p != path]
+      current = self._recent_files()
+      if current and current[0] == path:
+          return  # already most recent; nothing to persist or redraw
+      items = [p for p in current if p != path]
       items.insert(0, path)
-      s.setValue("recent_files", items[:10])
-      if hasattr(self, "_rebuild_recent_menu"):
+      items = items[:10]
+      self._recent_cache = items
+      self._recent_dirty = True   # written to QSettings in closeEvent
+      if self._refreshing:
+          return  # _post_load_refresh redraws the lists once at the end
+      if self._rebuild_recent_menu is not None:
           self._rebuild_recent_menu()
       self._refresh_recent_list()
 
+  @Slot()
   def _clear_recent_files(self):
       # Clear stored recent projects and refresh UI lists/menyus.
-      s = QSettings("Pile Analysis", "StudentEdition")
-      s.setValue("recent_files", [])
-      if hasattr(self, "_rebuild_recent_menu"):
+      self._recent_cache = []
+      self._recent_dirty = True
+      if self._rebuild_recent_menu is not None:
           self._rebuild_recent_menu()
       self._refresh_recent_list()
 
   def _open_path(self, path: str):
       try:
           self.project = load_project(path)
+          self._post_load_refresh(path)
+      except Exception as e:
+          QMessageBox.critical(self, "Open Failed", f"Could not open file.\n\n{e}")
+
+  def _post_load_refresh(self, path: str):
+      """One UI pass after self.project was replaced from a file."""
+      self._refreshing = True
+      try:
+          # Files may list layers in any order; edits insort and depth lookups bisect on from_m
+          self.project.get("soil_profile", []).sort(key=_layer_top)
+          self._rebuild_soa()
+          recent_before = self._recent_cache
           self._push_recent_file(path)
           self.statusBar().showMessage(f"Loaded {pathlib.Path(path).name}", 3000)
-          self.plot_area.clear()
-          self.refresh_ui()
+          self._clear_plot_tabs()
+          self._dirty = False
+          self._ei_cache = None
+          self.refresh_ui()   # also updates the status bar labels
           self._sync_lateral_bc_checks()
-      except Exception as e:
-          QMessageBox.critical(self, "Open Failed", f"Could not open file.\n\n{e}")
+          if self._recent_cache is not recent_before:
+              if self._rebuild_recent_menu is not None:
+                  self._rebuild_recent_menu()
+              self._refresh_recent_list()
+      finally:
+          self._refreshing = False
 
   def _update_status_bar(self):
       """Refresh the bottom status labels based on current project + dirty flag"""
@@ -654,7 +950,7 @@ class MainWindow(QMainWindow):
 
   def toggle_project_inspector(self):
     """Toggle: collapse to a thin strip (arrow visible) or expand back."""
-    if not hasattr(self, "_dock") or self._dock is None:
+    if self._dock is None:
         return
 
     collapsed_w = getattr(self, "_dock_collapsed_width", 28)
@@ -672,6 +968,7 @@ class MainWindow(QMainWindow):
         # keep dock from fighting the animation
         self._dock.setMinimumWidth(collapsed_w)
 
+        self._freeze_plots(True)
         self._dock_anim = QPropertyAnimation(self._dock, b"maximumWidth")
         self._dock_anim.setDuration(180)
         self._dock_anim.setEasingCurve(QEasingCurve.InOutCubic)
@@ -683,22 +980,21 @@ class MainWindow(QMainWindow):
 
         def on_finished():
             self._dock_is_collapsed = True
+            self._freeze_plots(False)
 
             # hide content, keep titlebar
             if self._dock.widget():
                 self._dock.widget().setVisible(False)
 
             # hide label so arrow has space
-            if hasattr(self, "_dock_title_label"):
+            if self._dock_title_label is not None:
                 self._dock_title_label.setVisible(False)
 
             self._dock.setFixedWidth(end_w)
             self._dock.setMaximumWidth(end_w)
 
-            if hasattr(self, "_dock_toggle_btn"):
-                self._dock_toggle_btn.setIcon(
-                    self.style().standardIcon(QStyle.StandardPixmap.SP_ArrowRight)
-                )
+            if self._dock_toggle_btn is not None:
+                self._dock_toggle_btn.setIcon(self._icon_right)
 
         self._dock_anim.valueChanged.connect(on_value_changed)
         self._dock_anim.finished.connect(on_finished)
@@ -710,7 +1006,7 @@ class MainWindow(QMainWindow):
     if self._dock.widget():
         self._dock.widget().setVisible(True)
 
-    if hasattr(self, "_dock_title_label"):
+    if self._dock_title_label is not None:
         self._dock_title_label.setVisible(True)
 
     start_w = collapsed_w
@@ -722,6 +1018,7 @@ class MainWindow(QMainWindow):
     self._dock.setMaximumWidth(start_w)
     self._dock.setMinimumWidth(collapsed_w)
 
+    self._freeze_plots(True)
     self._dock_anim = QPropertyAnimation(self._dock, b"maximumWidth")
     self._dock_anim.setDuration(180)
     self._dock_anim.setEasingCurve(QEasingCurve.InOutCubic)
@@ -733,21 +1030,34 @@ class MainWindow(QMainWindow):
 
     def on_finished():
         self._dock_is_collapsed = False
+        self._freeze_plots(False)
         self._dock.setFixedWidth(end_w)
         self._dock.setMaximumWidth(end_w)
         self._dock.setMinimumWidth(collapsed_w)
-        if hasattr(self, "_dock_toggle_btn"):
-            self._dock_toggle_btn.setIcon(
-                self.style().standardIcon(QStyle.StandardPixmap.SP_ArrowLeft)
-            )
+        if self._dock_toggle_btn is not None:
+            self._dock_toggle_btn.setIcon(self._icon_left)
 
     self._dock_anim.valueChanged.connect(on_value_changed)
     self._dock_anim.finished.connect(on_finished)
     self._dock_anim.start()
 
 
+  def _freeze_plots(self, on: bool):
+      """Hold plot redraws during the dock animation, then redraw visible plots once."""
+      _LazyCanvas.frozen = on
+      if not on:
+          for canvas in self.plot_area.findChildren(_LazyCanvas):
+              if canvas._agg_dirty and canvas.isVisible():
+                  canvas.draw_idle()
+
+  def _rebuild_soa(self):
+      """Refresh self._layers_soa after soil_profile is replaced or edited."""
+      self._layers_soa = _soil_soa((self.project or {}).get("soil_profile", []))
+      self._3d_dirty = True   # soil bands in the 3D view
+
   def _set_dirty(self, value: bool = True):
       self._dirty = bool(value)
+      self._ei_cache = None
       self._update_status_bar()
 
   def _set_lateral_bc(self, bc: str):
@@ -769,10 +1079,8 @@ class MainWindow(QMainWindow):
     if self.project is not None:
         bc = self.project.get("analysis", {}).get("lateral_bc", "free_head")
     
-    if hasattr(self, "actBCFree"):
-        self.actBCFree.setChecked(bc == "free_head")
-    if hasattr(self, "actBCFixed"):
-        self.actBCFixed.setChecked(bc == "fixed_head")
+    _set_checked_quiet(self.actBCFree, bc == "free_head")
+    _set_checked_quiet(self.actBCFixed, bc == "fixed_head")
 
   def dragEnterEvent(self, e):
       if e.mimeData().hasUrls():
@@ -794,6 +1102,40 @@ class MainWindow(QMainWindow):
               self._open_path(p)
               break
 
+  # Preview tab titles, filled per tab by _render_next_curve
+  _TZ_TITLE = "t-z Curve for Layer {n} ({ty}) at {d: .2f} m"
+  _PY_TITLE = "p-y Curve for Layer {n} ({ty}) at {d:.2f} m"
+  _QZ_TITLE = "q-z Curve at Pile Tip ({ty}) at {d:.2f} m"
+
+  def _curve_tab(self, key, x, y, title, xlabel, ylabel) -> QWidget:
+      """Preview tab for one curve; reuses the figure, canvas and toolbar from the last run."""
+      cached = self._curve_cache.get(key)
+      if cached is not None:
+          ax, line, canvas, wrap = cached
+          line.set_data(x, y)
+          # New data can keep the same axes limits, which is all the image cache key checks
+          self._img_cache.pop(canvas.figure, None)
+          ax.set_title(title)
+          ax.relim()
+          ax.autoscale_view()
+          canvas.draw_idle()
+          return wrap
+
+      fig = self._acquire_fig((8, 6))
+      ax = fig.add_subplot(111)
+      line, = ax.plot(x, y)
+      ax.set_title(title)
+      ax.set_xlabel(xlabel)
+      ax.set_ylabel(ylabel)
+      ax.grid(True)
+      canvas = _LazyCanvas(fig)
+      wrap = QWidget(); v = QVBoxLayout(wrap); v.setContentsMargins(6,6,6,6)
+      v.addWidget(_LazyToolbar(canvas, wrap))
+      v.addWidget(canvas)
+      self._curve_cache[key] = (ax, line, canvas, wrap)
+      return wrap
+
+  @Slot()
   def generate_curves(self):
             if self.project is None:
               QMessageBox.warning(self, "No Project", "Create or open a project first.")
@@ -810,65 +1152,75 @@ class MainWindow(QMainWindow):
             if not layers:
                 QMessageBox.warning(self, "No Soil", "Add soil layers first.")
                 return
-            self.plot_area.clear()
+            # Cached curve tabs are re-added (or released) below; everything else goes
+            self._clear_plot_tabs(keep={entry[-1] for entry in self._curve_cache.values()})
+            specs = []   # (cache key, x, y, title template, title args, xlabel, ylabel, tab label) per preview tab
+            announce = True
             
             # Assume tip in last layer for q-z
             tip_layer = layers[-1] if layers else None
+
+            # All t-z and p-y curves in one vectorized pass over the valid layers
+            soa = self._layers_soa
+            mids = (np.nan_to_num(soa["from_m"]) + np.nan_to_num(soa["to_m"])) * 0.5
+            valid = np.flatnonzero(~np.isnan(soa["gamma_kNpm3"])).tolist()
+            valid_layers = [layers[i] for i in valid]
+            tz_rows = dict(zip(valid, get_tz_curve_batch(valid_layers, D, mids[valid])))
+            y_py, p_rows = get_py_curve_batch(valid_layers, D, mids[valid])
+            py_rows = dict(zip(valid, p_rows))
+
             for i, layer in enumerate(layers):
-                mid_depth = (layer.get("from_m", 0) + layer.get("to_m", 0)) / 2
-                if "gamma_kNpm3" not in layer:
+                mid_depth = mids[i]
+                if i not in tz_rows:
                     QMessageBox.warning(self, "Data Error", f"Layer {i+1} missing gamma_kNpm3. Please re-enter soil data.")
                     continue
                 
                 # t-z
-                fig_tz, ax_tz = plt.subplots(figsize=(8, 6))
-                z_tz, t = get_tz_curve(layer, D, mid_depth)
-                ax_tz.plot(z_tz, t)
-                ax_tz.set_title(f't-z Curve for Layer {i+1} ({layer["type"]}) at {mid_depth: .2f} m')
-                ax_tz.set_xlabel('Displacement z (m)')
-                ax_tz.set_ylabel('Shaft Friction t (kPa)')
-                ax_tz.grid(True)
-                canvas_tz = FigureCanvas(fig_tz)
-                wrap = QWidget(); v = QVBoxLayout(wrap); v.setContentsMargins(6,6,6,6)
-                v.addWidget(NavigationToolbar(canvas_tz, wrap))
-                v.addWidget(canvas_tz)
-                self.plot_area.addTab(wrap, f"t-z Layer {i+1}")
+                z_tz, t = tz_rows[i]
+                args = {"n": i + 1, "ty": layer["type"], "d": mid_depth}
+                specs.append((("tz", i), z_tz, t, self._TZ_TITLE, args,
+                              'Displacement z (m)', 'Shaft Friction t (kPa)', f"t-z Layer {i+1}"))
 
                 # p-y
-                fig_py, ax_py = plt.subplots(figsize=(8, 6))
-                y_py, p = get_py_curve(layer, D, mid_depth)
-                ax_py.plot(y_py, p)
-                ax_py.set_title(f'p-y Curve for Layer {i+1} ({layer["type"]}) at {mid_depth:.2f} m')
-                ax_py.set_xlabel('Deflection y (m)')
-                ax_py.set_ylabel('Lateral Resistance p (kN/m)')
-                ax_py.grid(True)
-                canvas_py = FigureCanvas(fig_py)
-                wrap = QWidget(); v = QVBoxLayout(wrap); v.setContentsMargins(6,6,6,6)
-                v.addWidget(NavigationToolbar(canvas_py, wrap))
-                v.addWidget(canvas_py)
-                self.plot_area.addTab(wrap, f"p-y Layer {i+1}")
+                specs.append((("py", i), y_py, py_rows[i], self._PY_TITLE, args,
+                              'Deflection y (m)', 'Lateral Resistance p (kN/m)', f"p-y Layer {i+1}"))
 
             if tip_layer:
                 if "gamma_kNpm3" not in tip_layer:
                     QMessageBox.warning(self, "Data Error", "Tip layer missing gamma_kNpm3. Please re-enter soil data")
-                    return
-                
-                # q-z at tip
-                fig_qz, ax_qz = plt.subplots(figsize=(8, 6))
-                z_qz, q = get_qz_curve(tip_layer, D, L)
-                ax_qz.plot(z_qz, q)
-                ax_qz.set_title(f'q-z Curve at Pile Tip ({tip_layer["type"]}) at {L:.2f} m')
-                ax_qz.set_xlabel('Displacement z (m)')
-                ax_qz.set_ylabel('Tip Resistance q (kPa)')
-                ax_qz.grid(True)
-                canvas_qz = FigureCanvas(fig_qz)
-                wrap = QWidget(); v = QVBoxLayout(wrap); v.setContentsMargins(6,6,6,6)
-                v.addWidget(NavigationToolbar(canvas_qz, wrap))
-                v.addWidget(canvas_qz)
-                self.plot_area.addTab(wrap, f"q-z Layer {i+1}")
-            self.statusBar().showMessage("Curves generated and plotted", 3000)
-            QMessageBox.information(self, "Curves", "Preview plots generated")
+                    announce = False
+                else:
+                    # q-z at tip
+                    z_qz, q = get_qz_curve(tip_layer, D, L)
+                    specs.append((("qz",), z_qz, q, self._QZ_TITLE, {"ty": tip_layer["type"], "d": L},
+                                  'Displacement z (m)', 'Tip Resistance q (kPa)', f"q-z Layer {i+1}"))
+
+            # Layers that no longer exist: free their tabs
+            used = {spec[0] for spec in specs}
+            for key in [k for k in self._curve_cache if k not in used]:
+                self._release_tab(self._curve_cache.pop(key)[-1])
+
+            # Add one tab per event-loop tick so the window keeps repainting on large profiles
+            self._curve_gen += 1
+            self._curve_specs = iter(specs)
+            gen = self._curve_gen
+            QTimer.singleShot(0, lambda: self._render_next_curve(gen, announce))
+
+  def _render_next_curve(self, gen: int, announce: bool):
+      if gen != self._curve_gen:
+          return  # superseded by a newer generate_curves call
+      spec = next(self._curve_specs, None)
+      if spec is None:
+          if announce:
+              self.statusBar().showMessage("Curves generated and plotted", 3000)
+              QMessageBox.information(self, "Curves", "Preview plots generated")
+          return
+      key, x, y, title_fmt, title_args, xlabel, ylabel, label = spec
+      title = title_fmt.format(**title_args)   # formatted only when the tab is actually built
+      self.plot_area.addTab(self._curve_tab(key, x, y, title, xlabel, ylabel), label)
+      QTimer.singleShot(0, lambda: self._render_next_curve(gen, announce))
 
+  @Slot()
   def run_axial_analysis(self):
     if self.project is None or not self.project.get("pile") or not self.project.get("loads") or not self.project.get("soil_profile"):
         QMessageBox.warning(self, "Missing Data", "Edit Pile, loads, and add soil layers first.")
@@ -890,42 +1242,82 @@ class MainWindow(QMainWindow):
       return bar
 
     # Plot load-settlement
-    loads_kN = list(results['loads_kN'])
-    sett_mm = [1000.0 * abs(s) for s in results['settlements_m']]
+    loads_kN = np.asarray(results['loads_kN'], dtype=np.float64)
+    sett_mm = np.abs(np.asarray(results['settlements_m'], dtype=np.float64))
+    sett_mm *= 1000.0
 
     from matplotlib.ticker import MaxNLocator, FormatStrFormatter
 
-    fig_ls, ax_ls = plt.subplots(figsize=(9, 5), constrained_layout=True)
-    ax_ls.plot(sett_mm, loads_kN, marker='o', linewidth=2)
-    ax_ls.set_title('Load-Settlement Curve')
-    ax_ls.set_xlabel('Head Settlement (mm)')
-    ax_ls.set_ylabel('Axial Load (kN)')
-    ax_ls.set_xlim(0, max(1.0, (max(sett_mm) if sett_mm else 0) * 1.10))
-    ax_ls.set_ylim(0, (max(loads_kN) if loads_kN else 0) * 1.10)
-    ax_ls.grid(True, alpha=0.35)
-    ax_ls.xaxis.set_major_locator(MaxNLocator(6))
-    ax_ls.xaxis.set_minor_locator(MaxNLocator(12))
-    ax_ls.xaxis.set_major_formatter(FormatStrFormatter('%.2f'))
-
-    canvas_ls = FigureCanvas(fig_ls)
-    self._attach_export_context_menu(canvas_ls)
-    
-    ls_tab = QWidget()
-    ls_vbox = QVBoxLayout(ls_tab)
-    ls_vbox.setContentsMargins(6, 6, 6, 6)
-    ls_vbox.addWidget(NavigationToolbar(canvas_ls, ls_tab))
-    ls_vbox.addWidget(canvas_ls)
-    ls_vbox.addLayout(make_export_bar())
-    self.plot_area.addTab(ls_tab, "Load-Settlement")
+    # One reduction per array; the limits below reuse these
+    sm_max = float(sett_mm.max(initial=0.0))
+    lk_max = float(loads_kN.max(initial=0.0))
+    xlim = (0, max(1.0, sm_max * 1.10))
+    ylim = (0, lk_max * 1.10)
+
+    if self._ls_plot is not None:
+        # Rerun: update the existing Load-Settlement tab in place
+        ax_ls, line_ls, canvas_ls, ls_tab = self._ls_plot
+        fig_ls = ax_ls.figure
+        line_ls.set_data(sett_mm, loads_kN)
+        self._img_cache.pop(fig_ls, None)   # same limits no longer imply the same picture
+        if self.plot_area.indexOf(ls_tab) == -1:
+            self.plot_area.addTab(ls_tab, "Load-Settlement")
+        if (self._ls_bg is not None and not canvas_ls._agg_dirty
+                and ax_ls.get_xlim() == xlim and ax_ls.get_ylim() == ylim):
+            # Same axes: repaint only the curve over the saved background
+            canvas_ls.restore_region(self._ls_bg)
+            ax_ls.draw_artist(line_ls)
+            canvas_ls.blit(ax_ls.bbox)
+        else:
+            ax_ls.set_xlim(*xlim)
+            ax_ls.set_ylim(*ylim)
+            canvas_ls.draw_idle()
+    else:
+        fig_ls = self._acquire_fig((9, 5), constrained=True)
+        ax_ls = fig_ls.add_subplot(111)
+        # Animated: left out of screen draws so it can be blitted over a cached background
+        line_ls, = ax_ls.plot(sett_mm, loads_kN, marker='o', linewidth=2, animated=True)
+        ax_ls.set_title('Load-Settlement Curve')
+        ax_ls.set_xlabel('Head Settlement (mm)')
+        ax_ls.set_ylabel('Axial Load (kN)')
+        ax_ls.set_xlim(*xlim)
+        ax_ls.set_ylim(*ylim)
+        ax_ls.grid(True, alpha=0.35)
+        ax_ls.xaxis.set_major_locator(MaxNLocator(6))
+        ax_ls.xaxis.set_minor_locator(MaxNLocator(12))
+        ax_ls.xaxis.set_major_formatter(FormatStrFormatter('%.2f'))
+
+        canvas_ls = _LazyCanvas(fig_ls)
+        self._attach_export_context_menu(canvas_ls)
+
+        def on_draw(evt, ax=ax_ls, line=line_ls, canvas=canvas_ls):
+            # Saves draw at their own dpi (or on a vector canvas) and already include the curve
+            if evt.canvas is not canvas or canvas.is_saving():
+                return
+            # Full redraw (first show, resize, zoom): re-capture the background, then add the curve
+            self._ls_bg = canvas.copy_from_bbox(ax.bbox)
+            ax.draw_artist(line)
+        canvas_ls.mpl_connect("draw_event", on_draw)
+        
+        ls_tab = QWidget()
+        ls_vbox = QVBoxLayout(ls_tab)
+        ls_vbox.setContentsMargins(6, 6, 6, 6)
+        ls_vbox.addWidget(NavigationToolbar(canvas_ls, ls_tab))
+        ls_vbox.addWidget(canvas_ls)
+        ls_vbox.addLayout(make_export_bar())
+        self.plot_area.addTab(ls_tab, "Load-Settlement")
+        self._ls_plot = (ax_ls, line_ls, canvas_ls, ls_tab)
+        self._ls_bg = None
 
     self._axial_figures.append(fig_ls)
 
     # Plot shear vs depth
-    shear_kN = [s / 1000.0 for s in results['plots']['shear_N']]
-    depth_m = list(results['plots']['z_m'])
-    shear_max = max(shear_kN) if shear_kN else 0.0
+    shear_kN = np.asarray(results['plots']['shear_N'], dtype=np.float64) / 1000.0
+    depth_m = np.asarray(results['plots']['z_m'], dtype=np.float64)
+    shear_max = float(shear_kN.max(initial=0.0))
 
-    fig_sd, ax_sd = plt.subplots(figsize=(9, 5), constrained_layout=True)
+    fig_sd = self._acquire_fig((9, 5), constrained=True)
+    ax_sd = fig_sd.add_subplot(111)
     ax_sd.plot(shear_kN, depth_m, marker='o', linewidth=2)
     ax_sd.set_title('Cumulative Shaft Shear vs Depth')
     ax_sd.set_xlabel('Cumulative Shear (kN)')
@@ -934,7 +1326,7 @@ class MainWindow(QMainWindow):
     ax_sd.set_xlim(0, max(1e-3, shear_max * 1.10))
     ax_sd.grid(True, alpha=0.35)
 
-    canvas_sd = FigureCanvas(fig_sd)
+    canvas_sd = _LazyCanvas(fig_sd)
     self._attach_export_context_menu(canvas_sd)
     
     sd_tab = QWidget()
@@ -952,6 +1344,7 @@ class MainWindow(QMainWindow):
         "Axial Analysis complete. Use File -> Export or right-click a plot to save.", 5000
     )
   
+  @Slot()
   def run_lateral_analysis(self):
     if self.project is None:
         QMessageBox.warning(self, "No Project", "Create or open a project first.")
@@ -977,8 +1370,7 @@ class MainWindow(QMainWindow):
         return
 
     #----Compute stiffness (EI)------
-    I = 3.14159265358979 * (D ** 4) / 64.0 # moment of inertia for circular crosss-section
-    EI = E * I 
+    I, EI = _circular_EI(D, E)
 
     pile = LatPileProps(length_m=L, EI_Nm2=EI, d_m=D, n_nodes=81)
 
@@ -998,43 +1390,72 @@ class MainWindow(QMainWindow):
         bar.addWidget(btn_pdf)
         bar.addStretch(1)
         return bar
+
+    # Canvas + toolbar for a result tab, built the first time the tab is shown.
+    # The figures themselves are made up front so the PDF export always has all four.
+    def fill_lateral_tab(tab, fig):
+        canvas = _LazyCanvas(fig)
+        self._attach_export_context_menu(canvas, kind="lateral")
+        vbox = QVBoxLayout(tab)
+        vbox.setContentsMargins(6, 6, 6, 6)
+        vbox.addWidget(NavigationToolbar(canvas, tab))
+        vbox.addWidget(canvas)
+        vbox.addLayout(make_export_bar())
     
+    # Layer bounds for a binary-search lookup (soil_profile is sorted by from_m on load and kept so by edits)
+    from_bounds = np.ascontiguousarray(np.nan_to_num(self._layers_soa["from_m"]))
+    to_bounds = np.ascontiguousarray(np.nan_to_num(self._layers_soa["to_m"]))
+    n_layers = len(soil_layers)
+
+    last_hit = [0]   # depths usually arrive in z-order, so try the previous layer and its successor first
+
     def layer_at_depth(depth_m: float):
-        for layer in soil_layers:
-            if layer.get("from_m", 0.0) <= depth_m < layer.get("to_m", 0.0):
-                return layer
-        return soil_layers[-1]
+        # Layer with from_m <= depth < to_m; depths in a gap or outside the profile get the last layer
+        i = last_hit[0]
+        for j in (i, i + 1):
+            if j < n_layers and from_bounds[j] <= depth_m < to_bounds[j]:
+                last_hit[0] = j
+                return soil_layers[j]
+        i = int(np.searchsorted(from_bounds, depth_m, side="right")) - 1
+        if i < 0 or not depth_m < to_bounds[i]:
+            i = n_layers - 1
+        last_hit[0] = i
+        return soil_layers[i]
     
-    def py_backbone(y_val: float, z_val: float) -> float:
-        lyr = layer_at_depth(z_val)
-        y_vals, p_vals_kNm = get_py_curve(lyr, D, z_val)
-        
-        if callable(y_vals) or callable(p_vals_kNm):
-            print(f"[p-y] invalid curve (callable) at z={z_val:.2f} m, layer={lyr.get('type')}")
-            return 0.0
-        try:
-            y_np = np.asarray(y_vals, dtype=float).ravel()
-            p_np = np.asarray(p_vals_kNm, dtype=float).ravel()
-        except Exception as e:
-            print(f"[p-y] exception building curve at z={z_val:.2f} m, layer={lyr.get('type')}: {e}")
-            return 0.0
-        if y_np.size == 0 or p_np.size == 0 or y_np.size != p_np.size:
-            print(f"[p-y] bad sizes at z={z_val:.2f} m (|y|={y_np.size}, |p|={p_np.size}), layer={lyr.get('type')}")
-            return 0.0
-        
-        order = np.argsort(y_np)
-        y_sorted = y_np[order]
-        p_sorted = p_np[order]
+    # p-y curves depend only on (layer, depth), so tabulate them once for every solver node
+    # instead of rebuilding and sorting a curve on each spring call
+    z_nodes = np.linspace(0.0, L, pile.n_nodes)
+    # Same rule as layer_at_depth: from_m <= z < to_m, otherwise the last layer
+    node_layer = np.searchsorted(from_bounds, z_nodes, side="right") - 1
+    inside = (node_layer >= 0) & (z_nodes < to_bounds[np.maximum(node_layer, 0)])
+    node_layer = np.where(inside, node_layer, n_layers - 1)
+    # Per-node soil columns gathered from the layer struct-of-arrays; no dict lookups per node
+    soa = self._layers_soa
+    layer_types = [str(t or "").strip().lower() for t in soa["type"]]
+    y_tab, p_tab = get_py_curve_columns(
+        [layer_types[i] for i in node_layer],
+        np.nan_to_num(soa["gamma_kNpm3"])[node_layer],
+        soa["undrained_shear_strength_kPa"][node_layer],
+        soa["phi_deg"][node_layer],
+        D, z_nodes,
+    )
+    p_tab *= 1000.0   # kN/m -> N/m
+    py_rows = {float(zn): p_tab[i] for i, zn in enumerate(z_nodes)}
 
-        yq = float(np.clip(y_val, y_sorted[0], y_sorted[-1]))
-        p_kNm = float(np.interp(yq, y_sorted, p_sorted))
-        return p_kNm * 1000.0
+    def py_backbone(y_val: float, z_val: float) -> float:
+        p_row = py_rows.get(float(z_val))
+        if p_row is None:
+            # Off-mesh depth (e.g. the debug probes): build that one curve
+            p_row = get_py_curve_batch([layer_at_depth(z_val)], D, [z_val])[1][0] * 1000.0
+        # y_tab is ascending and np.interp clamps to the end values
+        return float(np.interp(y_val, y_tab, p_row))
 
     py_spring = make_py_spring(py_backbone)
 
-    for z_test in [0.0, 0.5*L, 0.9*L]:
-        p_test, k_test = py_spring(1e-3, z_test)
-        print(f"[probe] z={z_test:.2f} m -> p={p_test:.1f} N/m, k={k_test:.1f} N/m^2")
+    if log.isEnabledFor(logging.DEBUG):
+        for z_test in [0.0, 0.5*L, 0.9*L]:
+            p_test, k_test = py_spring(1e-3, z_test)
+            log.debug("[probe] z=%.2f m -> p=%.1f N/m, k=%.1f N/m^2", z_test, p_test, k_test)
 
     # Define Load steps (kN -> N)
     loads = (self.project.get("loads") or {})
@@ -1042,8 +1463,13 @@ class MainWindow(QMainWindow):
     M_user_kNm = float(loads.get("moment_kNm", 0.0))
     M_user_Nm = M_user_kNm * 1e3
 
-    grid = np.linspace(0.0, H_user_kN, 4)
-    steps = [LateralLoadCase(H_N=float(h) * 1e3, M_Nm=M_user_Nm) for h in grid]
+    # Reuse the load grid when the head load has not changed since the last run
+    n_steps = 4
+    steps_key = (H_user_kN, n_steps)
+    H_steps_N = self._lateral_steps_cache.get(steps_key)
+    if H_steps_N is None:
+        H_steps_N = np.linspace(0.0, H_user_kN * 1e3, n_steps)
+        self._lateral_steps_cache = {steps_key: H_steps_N}
 
     # Solver configuration
     bc_str = self.project.get("analysis", {}).get("lateral_bc", "free_head")
@@ -1052,8 +1478,9 @@ class MainWindow(QMainWindow):
     cfg = LateralConfig(bc=bc_enum, max_iters=80, tol=1e-6, relax=0.8)
 
     # Run analysis
-    out = lateral_analysis(pile, steps, py_spring, cfg)
+    out = lateral_analysis_batch(pile, H_steps_N, M_user_Nm, py_spring, cfg, py_spring_vec=make_py_spring_table(y_tab, p_tab))
     self.last_lateral_out = out
+    self._3d_dirty = True   # deflection overlay
     self._lateral_figures = []
 
     pairs = out.get("head_curve", [])
@@ -1062,28 +1489,19 @@ class MainWindow(QMainWindow):
         return
 
     #------Plot Head Load-Deflection Curve-------
-    H_kN = np.array([h for (h, y0) in pairs], dtype=float) / 1e3
-    y_head_mm = np.array([y0 for (h, y0) in pairs], dtype=float) * 1e3
+    hy = np.asarray(pairs, dtype=np.float64)
+    H_kN = hy[:, 0] / 1e3
+    y_head_mm = hy[:, 1] * 1e3
 
-    fig1, ax1 = plt.subplots(figsize=(9, 5), constrained_layout=True)
+    fig1 = self._acquire_fig((9, 5), constrained=True)
+    ax1 = fig1.add_subplot(111)
     ax1.plot(y_head_mm, H_kN, marker="o", linewidth=2)
-    ax1.set_title(f"Lateral Load-Deflection (H up to {grid[-1]:.0f} kN)")
+    ax1.set_title(f"Lateral Load-Deflection (H up to {H_user_kN:.0f} kN)")
     ax1.set_xlabel("Head Deflection (mm)")
     ax1.set_ylabel("Applied Lateral Load H (kN)")
     ax1.grid(True, alpha=0.35)
 
-    canvas1 = FigureCanvas(fig1)
-    try:
-        self._attach_export_context_menu(canvas1, kind="lateral")
-    except TypeError:
-        self._attach_export_context_menu(canvas1)
-    tab1 = QWidget()
-    vbox1 = QVBoxLayout(tab1)
-    vbox1.setContentsMargins(6, 6, 6, 6)
-    vbox1.addWidget(NavigationToolbar(canvas1, tab1))
-    vbox1.addWidget(canvas1)
-    vbox1.addLayout(make_export_bar())
-    self.plot_area.addTab(tab1, "Lateral H-y")
+    tab1 = self._add_deferred_plot_tab(fig1, "Lateral H-y", fill_lateral_tab)
     self._lateral_figures.append(fig1)
     
 
@@ -1092,85 +1510,64 @@ class MainWindow(QMainWindow):
         QMessageBox.warning(self, "No Data", "No step results to plot.")
         return
     last = out["steps"][-1]
-    print("Lateral post max |y|: ", float(np.max(np.abs(last.y_m))))
-    print("Lateral post max |M| :(", float(np.max(np.abs(last.M_Nm))))
-    print("Lateral post max |V|: ", float(np.max(np.abs(last.V_N))))
 
-    fig2, ax2 = plt.subplots(figsize=(9, 5), constrained_layout=True)
-    ax2.plot(last.y_m * 1e3, last.z_m, linewidth=2)
+    # Convert the last step to plotting units once; exporters reuse these
+    z = last.z_m
+    y_mm = last.y_m * 1e3
+    M_kNm = last.M_Nm * 1e-3
+    V_kN = last.V_N * 1e-3
+    self.last_lateral_arrays = dict(z=z, y_mm=y_mm, M_kNm=M_kNm, V_kN=V_kN)
+
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("Lateral post max |y|: %g", float(np.max(np.abs(last.y_m))))
+        log.debug("Lateral post max |M|: %g", float(np.max(np.abs(last.M_Nm))))
+        log.debug("Lateral post max |V|: %g", float(np.max(np.abs(last.V_N))))
+
+    fig2 = self._acquire_fig((9, 5), constrained=True)
+    ax2 = fig2.add_subplot(111)
+    ax2.plot(y_mm, z, linewidth=2)
     ax2.invert_yaxis()
     ax2.set_xlabel("Deflection (mm)")
     ax2.set_ylabel("Depth (m)")
     ax2.grid(True, alpha=0.35)
 
-    canvas2 = FigureCanvas(fig2)
-    try:
-        self._attach_export_context_menu(canvas2, kind="lateral")
-    except TypeError:
-        self._attach_export_context_menu(canvas2)
-    tab2 = QWidget()
-    vbox2 = QVBoxLayout(tab2)
-    vbox2.setContentsMargins(6, 6, 6, 6)
-    vbox2.addWidget(NavigationToolbar(canvas2, tab2))
-    vbox2.addWidget(canvas2)
-    vbox2.addLayout(make_export_bar())
-    self.plot_area.addTab(tab2, "Deflection vs Depth")
+    self._add_deferred_plot_tab(fig2, "Deflection vs Depth", fill_lateral_tab)
     self._lateral_figures.append(fig2)
 
     self.plot_area.setCurrentWidget(tab1)
 
     #------Moment & Shear vs Depth (derived from deflection)-------
-    z = last.z_m
-    y = last.y_m
-    M = last.M_Nm
-    V = last.V_N
-    
     # Moment vs Depth
-    figM, axM = plt.subplots(figsize=(9, 5), constrained_layout=True)
-    axM.plot(M / 1e3, z, linewidth=2)
+    figM = self._acquire_fig((9, 5), constrained=True)
+    axM = figM.add_subplot(111)
+    axM.plot(M_kNm, z, linewidth=2)
     axM.invert_yaxis()
     axM.set_xlabel("Moment (kN.m)")
     axM.set_ylabel("Depth (m)")
     axM.set_title("Moment vs Depth")
     axM.grid(True, alpha=0.35)
 
-    canvasM = FigureCanvas(figM)
-    self._attach_export_context_menu(canvasM, kind="lateral")
-    tabM = QWidget()
-    vM = QVBoxLayout(tabM)
-    vM.setContentsMargins(6,6,6,6)
-    vM.addWidget(NavigationToolbar(canvasM, tabM))
-    vM.addWidget(canvasM)
-    vM.addLayout(make_export_bar())
-    self.plot_area.addTab(tabM, "Moment vs Depth")
+    self._add_deferred_plot_tab(figM, "Moment vs Depth", fill_lateral_tab)
     self._lateral_figures.append(figM)
 
     # Shear vs Depth
-    figV, axV = plt.subplots(figsize=(9, 5), constrained_layout=True)
-    axV.plot(V / 1e3, z, linewidth=2)
+    figV = self._acquire_fig((9, 5), constrained=True)
+    axV = figV.add_subplot(111)
+    axV.plot(V_kN, z, linewidth=2)
     axV.invert_yaxis()
     axV.set_xlabel("Shear (kN)")
     axV.set_ylabel("Depth (m)")
     axV.set_title("Shear vs Depth")
     axV.grid(True, alpha=0.35)
 
-    canvasV = FigureCanvas(figV)
-    self._attach_export_context_menu(canvasV, kind="lateral")
-    tabV = QWidget()
-    vV = QVBoxLayout(tabV)
-    vV.setContentsMargins(6,6,6,6)
-    vV.addWidget(NavigationToolbar(canvasV, tabV))
-    vV.addWidget(canvasV)
-    vV.addLayout(make_export_bar())
-    self.plot_area.addTab(tabV, "Shear vs Depth (Lateral)")
+    self._add_deferred_plot_tab(figV, "Shear vs Depth (Lateral)", fill_lateral_tab)
     self._lateral_figures.append(figV)
 
   #---------Right click export menu------------------
   def _attach_export_context_menu(self, widget: QWidget, kind: str = "axial"):
       widget.setContextMenuPolicy(Qt.CustomContextMenu)
-      widget.customContextMenuRequested.connect(
-          lambda pos, w=widget, k=kind: self._show_export_menu(w, pos, k)
-      )  
+      # partial binds widget and kind without a per-canvas Python closure; pos is appended by the signal
+      widget.customContextMenuRequested.connect(partial(self._show_export_menu, widget, kind))
 
   def open_3d_view(self):
     """create/show the 3D pile viewer dock and render the current projects."""
@@ -1192,13 +1589,14 @@ class MainWindow(QMainWindow):
         self._3d_scale_spin.setDecimals(1)
         self._3d_scale_spin.setValue(50.0)
         self._3d_scale_spin.setSuffix(" x")
-        self._3d_scale_spin.valueChanged.connect(self._refresh_3d_view)
+        self._3d_scale_spin.valueChanged.connect(self._on_3d_scale_changed)
         fl.addRow("Deflection scale:", self._3d_scale_spin)
         ctrl.setLayout(fl)
         v.addWidget(ctrl)
 
-        # matplotlib 3D figure
-        self._3d_fig = plt.figure(figsize=(6.5, 6), constrained_layout=True)
+        # matplotlib 3D figure (mplot3d is only loaded once the viewer is opened)
+        from mpl_toolkits.mplot3d import Axes3D  # noqa: F401  registers the '3d' projection
+        self._3d_fig = Figure(figsize=(6.5, 6), constrained_layout=True)
         self._3d_ax = self._3d_fig.add_subplot(111, projection='3d')
         self._3d_canvas = FigureCanvas(self._3d_fig)
         v.addWidget(NavigationToolbar(self._3d_canvas, host))
@@ -1208,15 +1606,70 @@ class MainWindow(QMainWindow):
         self._dock3d.setWidget(host)
         self.addDockWidget(Qt.RightDockWidgetArea, self._dock3d)
 
+        # Full-resolution redraw once the scale spin box has been idle for a moment
+        self._3d_debounce = QTimer(self)
+        self._3d_debounce.setSingleShot(True)
+        self._3d_debounce.setInterval(120)
+        self._3d_debounce.timeout.connect(self._update_3d_deflection)
+
     self._dock3d.show()
     self._dock3d.raise_()
     self._refresh_3d_view()
 
+  @Slot(float)
+  def _on_3d_scale_changed(self, _value: float):
+      # Only the scaled overlay depends on the value. The first step of a burst redraws it
+      # on a coarse mesh; the rest just restart the timer, and the full mesh is drawn
+      # once the spin box has been idle for 120 ms
+      if not self._3d_debounce.isActive():
+          self._update_3d_deflection(draft=True)
+      self._3d_debounce.start()
+
+  @Slot()
+  def _update_3d_deflection(self, draft: bool = False):
+      """Redraw only the scaled deflected cylinder, centerline and legend over the cached static scene."""
+      if self._3d_ax is None or self._3d_grid is None:
+          return
+      for art in self._3d_defl_artists:
+          art.remove()
+      self._3d_defl_artists = []
+      handles = list(self._3d_legend_base)
+
+      if self._3d_defl is not None:
+          z_defl, y_defl = self._3d_defl
+          X, Y, Z, z_line = self._3d_grid
+          if draft:
+              X, Y, Z, z_line = X[::2, ::2], Y[::2, ::2], Z[::2, ::2], z_line[::2]
+          scale = float(self._3d_scale_spin.value() if self._3d_scale_spin else 50.0)
+          xd = scale * y_defl
+          # centerline
+          line, = self._3d_ax.plot(xd, np.zeros_like(xd), -z_defl, lw=2.2, color="C3", label="Deflected centerline")
+          # deflected cylinder (translate x by deflection)
+          dz = (z_defl[-1] - z_defl[0]) / (z_defl.size - 1)
+          if dz > 0 and np.allclose(np.diff(z_defl), dz):
+              # Solver mesh is uniform: index arithmetic instead of a binary search per point
+              y_interp = _interp_uniform(z_line, z_defl[0], dz, xd)
+          else:
+              y_interp = np.interp(z_line, z_defl, xd)
+          Xdef = X + y_interp[None, :]
+          surf = self._3d_ax.plot_surface(Xdef, Y, Z, color=(0.92, 0.55, 0.55), alpha=0.35, rstride=1, cstride=6, linewidth=0, antialiased=True, shade=True, rasterized=True)
+          self._3d_defl_artists = [line, surf]
+          handles.append(mpatches.Patch(facecolor=(0.92,0.55,0.55), alpha=0.35, edgecolor='none', label='Pile (deflected x{})'.format(int(scale))))
+          handles.append(Line2D([0], [0], color="C3", lw=2.2, label='Deflected centerline'))
+
+      # Place legend in the upper-left corner inside the axes pane
+      self._3d_ax.legend(handles=handles, loc='upper left', bbox_to_anchor=(0.2,0.98), fontsize=8, frameon=True)
+      self._3d_canvas.draw_idle()
+
+  @Slot()
   def _refresh_3d_view(self):
-      """Render pile  + soil + optional lateral deflection in the 3D axes."""
+      """Rebuild the static 3D scene (soil + undeformed pile), then the deflection overlay."""
       if self._3d_ax is None:
           return
       self._3d_ax.clear()
+      self._3d_grid = None
+      self._3d_defl = None
+      self._3d_defl_artists = []
 
       # read inputs
       proj = self.project or {}
@@ -1231,7 +1684,7 @@ class MainWindow(QMainWindow):
 
       if L <= 0.0 or D <= 0.0:
           self._3d_ax.text2D(0.05, 0.95, "Define pile (L, D) to view 3D", transform=self._3d_ax.transAxes)
-          self._3d_canvas.draw()
+          self._3d_canvas.draw_idle()
           return
       
       R = 0.5 * D
@@ -1249,8 +1702,13 @@ class MainWindow(QMainWindow):
       
       seen_soil = set() # track which soil types appear for the legend
       
-      # draw soil layers as translucent rectangular bands
+      # draw soil layers as translucent rectangular bands: every side and cap quad
+      # goes into a single Poly3DCollection so the axes project one artist, not 5 per layer
+      from mpl_toolkits.mplot3d.art3d import Poly3DCollection
       half = 2.5 * D
+      ring = ((-half, -half), (half, -half), (half, half), (-half, half))
+      verts = []
+      face_colors = []
       for Lyr in layers:
           try:
               z0 = float(Lyr.get("from_m", 0.0))
@@ -1262,61 +1720,43 @@ class MainWindow(QMainWindow):
           c = soil_color(Lyr)
           typ = (Lyr.get("type") or "").lower()
           seen_soil.add(typ)
-          Xs = np.array([[-half, -half], [half, half]])
-          Ys = np.array([[-half, half], [-half, half]])
-          Z0 = -z0 * np.ones_like(Xs)
-          Z1 = -z1 * np.ones_like(Xs)
           # four sides
-          self._3d_ax.plot_surface(-half*np.ones_like(Xs), Ys, np.vstack([Z0[0], Z1[0]]), alpha=c[3], color=c[:3], linewidth=0, shade=True)
-          self._3d_ax.plot_surface(half*np.ones_like(Xs), Ys, np.vstack([Z0[0], Z1[0]]), alpha=c[3], color=c[:3], linewidth=0, shade=True)
-          self._3d_ax.plot_surface(Xs, -half*np.ones_like(Xs), np.vstack([Z0[0], Z1[0]]), alpha=c[3], color=c[:3], linewidth=0, shade=True)
-          self._3d_ax.plot_surface(Xs, half*np.ones_like(Xs), np.vstack([Z0[0], Z1[0]]), alpha=c[3], color=c[:3], linewidth=0, shade=True)
+          for (xa, ya), (xb, yb) in zip(ring, ring[1:] + ring[:1]):
+              verts.append(((xa, ya, -z0), (xb, yb, -z0), (xb, yb, -z1), (xa, ya, -z1)))
+              face_colors.append(c)
           #top cap (horizontal plane at z0)
-          Zcap_top = -z0 * np.ones_like(Xs)
-          self._3d_ax.plot_surface(
-              Xs, Ys, Zcap_top,
-              alpha=max(0.15, c[3]-0.2),
-              color=c[:3],
-              linewidth=0,
-              shade=False
-          )
+          verts.append(tuple((x, y, -z0) for x, y in ring))
+          face_colors.append(c[:3] + (max(0.15, c[3]-0.2),))
+      if verts:
+          self._3d_ax.add_collection3d(Poly3DCollection(verts, facecolors=face_colors, linewidths=0, rasterized=True))
 
       # draw pile cylinder (undeformed)
       z_line = np.linspace(0.0, L, 260)
-      Z = -z_line[None, :]
-      Xc = (R * np.cos(theta))[:, None]
-      Yc = (R * np.sin(theta))[:, None]
-      X = np.repeat(Xc, Z.shape[1], axis=1)
-      Y = np.repeat(Yc, Z.shape[1], axis=1)
-      Z = np.repeat(Z, X.shape[0], axis=0)
-      self._3d_ax.plot_surface(X, Y, Z, color=(0.75, 0.78, 0.84), alpha=0.98, rstride=1, cstride=1, linewidth=0.0, antialiased=True, shade=True)
-
-      # demo: overlay lateral deflection of last step, scaled
-      scale = float(self._3d_scale_spin.value() if self._3d_scale_spin else 50.0)
-      y_defl = None
-      z_defl = None
+      # Read-only broadcast views; plot_surface never writes to its inputs
+      grid_shape = (n_theta, z_line.size)
+      X = np.broadcast_to((R * np.cos(theta))[:, None], grid_shape)
+      Y = np.broadcast_to((R * np.sin(theta))[:, None], grid_shape)
+      Z = np.broadcast_to(-z_line[None, :], grid_shape)
+      self._3d_ax.plot_surface(X, Y, Z, color=(0.75, 0.78, 0.84), alpha=0.98, rstride=1, cstride=1, linewidth=0.0, antialiased=True, shade=True, rasterized=True)
+
+      self._3d_grid = (X, Y, Z, z_line)
+
+      # lateral deflection of the last step, drawn (scaled) by _update_3d_deflection
       if getattr(self, "last_lateral_out", None):
           steps = self.last_lateral_out.get("steps", [])
           if steps:
               last = steps[-1]
               z_defl = np.asarray(getattr(last, "z_m", []), dtype=float).reshape(-1)
               y_defl = np.asarray(getattr(last, "y_m", []), dtype=float).reshape(-1)
-
-      if y_defl is not None and z_defl is not None and z_defl.size > 2 and y_defl.size == z_defl.size:
-          xd = scale * y_defl
-          # centerline
-          self._3d_ax.plot(xd, np.zeros_like(xd), -z_defl, lw=2.2, color="C3", label="Deflected centerline")
-          # deflected cylinder (translate x by deflection)
-          y_interp = np.interp(-Z[0, :], -z_defl, xd)
-          Xdef = X + y_interp[None, :]
-          self._3d_ax.plot_surface(Xdef, Y, Z, color=(0.92, 0.55, 0.55), alpha=0.35, rstride=1, cstride=6, linewidth=0, antialiased=True, shade=True)
+              if z_defl.size > 2 and y_defl.size == z_defl.size:
+                  self._3d_defl = (z_defl, y_defl)
 
       # ground plane
       gx = np.linspace(-2*D, 2*D, 10)
       gy = np.linspace(-2*D, 2*D, 10)
       GX, GY = np.meshgrid(gx, gy)
       GZ = np.zeros_like(GX)
-      self._3d_ax.plot_surface(GX, GY, GZ, alpha=0.15, color=(0.5, 0.7, 0.95))
+      self._3d_ax.plot_surface(GX, GY, GZ, alpha=0.15, color=(0.5, 0.7, 0.95), rasterized=True)
 
       # axes styling
       self._3d_ax.set_xlabel("X (m)")
@@ -1362,25 +1802,131 @@ class MainWindow(QMainWindow):
       # Pile (undeformed) proxy
       handles.append(mpatches.Patch(facecolor=(0.75,0.78,0.84), alpha=0.95, edgecolor='none', label='Pile (undeformed)'))
 
-      # Deflected pile + centerline proxies (only if we drew them)
-      if y_defl is not None and z_defl is not None and z_defl.size > 2 and y_defl.size == z_defl.size:
-          handles.append(mpatches.Patch(facecolor=(0.92,0.55,0.55), alpha=0.35, edgecolor='none', label='Pile (deflected x{})'.format(int(scale))))
-          handles.append(Line2D([0], [0], color="C3", lw=2.2, label='Deflected centerline'))
-      
-      # Place legend in the upper-left corner inside the axes pane
-      self._3d_ax.legend(handles=handles, loc='upper left', bbox_to_anchor=(0.2,0.98), fontsize=8, frameon=True)
-      
-      self._3d_canvas.draw()
+      self._3d_legend_base = handles
+      self._update_3d_deflection()
+      self._3d_dirty = False
           
 
-  #------include axial analysis graphs in pdf report-------
-  def _figure_to_imagereader(self, fig, dpi=200):
-      buf = io.BytesIO()
-      fig.savefig(buf, format="png", dpi=dpi, bbox_inches="tight")
-      buf.seek(0)
-      return ImageReader(buf)
-      
-  def _show_export_menu(self, widget: QWidget, pos: QPoint, kind: str):
+  #------include analysis graphs in pdf report-------
+  def _get_EI(self) -> float:
+      """Pile EI in N·m²: the last lateral run's value, else computed from the pile inputs."""
+      EI = float(((self.last_lateral_out or {}).get("meta") or {}).get("EI_Nm2", 0.0))
+      if EI > 0.0:
+          return EI
+      if self._ei_cache is None:
+          pile = (self.project or {}).get("pile", {})
+          D = float(pile.get("diameter_m", 0.0))
+          E = float(pile.get("elastic_modulus_pa", 0.0))
+          self._ei_cache = _circular_EI(D, E)[1] if D > 0 and E > 0 else 0.0
+      return self._ei_cache
+
+  def _img_cache_key(self, fig, dpi):
+      # Rendered image stays valid while dpi and axes limits are unchanged
+      return (dpi, tuple(tuple(ax.viewLim.bounds) for ax in fig.axes))
+
+  def _report_input_lines(self) -> list[str]:
+      """Units, pile, loads and soil layer summary printed on the first PDF page."""
+      meta = self.project.get("meta", {})
+      pile = self.project.get("pile", {})
+      loads = self.project.get("loads", {})
+      layers = self.project.get("soil_profile", [])
+
+      units = meta.get("units", "SI")
+
+      E = pile.get("elastic_modulus_pa")
+      E_txt = f"{E/1e9:.2f} GPa" if E else "-"
+      gamma = pile.get("unit_weight_kNpm3", "-")
+
+      moment_kNm = loads.get("moment_kNm", loads.get("moment_kN", "-"))
+
+      out = [
+          f"Units: {units}",
+          f"Pile: L = {pile.get('length_m', '-')} m, "
+          f"D = {pile.get('diameter_m', '-')} m, "
+          f"E = {E_txt}, "
+          f"γ = {gamma} kN/m³",
+          f"Loads: Axial = {loads.get('axial_kN', '-')} kN, "
+          f"Lateral = {loads.get('lateral_kN', '-')} kN, "
+          f"Moment = {moment_kNm} kN.m",
+      ]
+
+      if layers:
+          out.append("Soil Layers:")
+          for i, L in enumerate(layers, 1):
+              soil_type = (L.get("type") or "?").title()
+              gL = L.get("gamma_kNpm3", "-")
+              if L.get("type") == "clay":
+                  strength = f"su = {L.get('undrained_shear_strength_kPa', '-')} kPa"
+              else:
+                  strength = f"φ = {L.get('phi_deg', '-')}°"
+              out.append(
+                  f" {i}) {soil_type}, "
+                  f"{L.get('from_m', '?')}-{L.get('to_m', '?')} m, "
+                  f"γ = {gL} kN/m³, {strength}"
+              )
+      else:
+          out.append("Soil Layers: (none defined)")
+      return out
+
+  def _start_pdf_export(self, path, caption, heading, figs, empty_note, dpi=None, synthesized=()):
+      """
+      Write the report on the global thread pool so the window stays responsive.
+
+      synthesized lists the figures built just for this report; they are cleared when it is done.
+      """
+      if dpi is None:
+          # Raster resolution for report figures; 150 dpi prints cleanly at a fraction of 220's pixels
+          dpi = int(self._settings.value("export/dpi", 150))
+      keys = [self._img_cache_key(fig, dpi) for fig in figs]
+      images = []
+      for fig, key in zip(figs, keys):
+          cached = self._img_cache.get(fig)
+          images.append(cached[1] if cached is not None and cached[0] == key else None)
+
+      # Workers get detached copies; the live figures belong to on-screen canvases
+      snaps = [pickle.loads(pickle.dumps(fig)) for fig in figs]
+      # Blitted on-screen artists (the Load-Settlement line) are animated; a report draws them normally
+      for snap in snaps:
+          for artist in snap.findobj(lambda a: a.get_animated()):
+              artist.set_animated(False)
+      lines = self._report_input_lines()
+
+      def job():
+          rendered = render_pdf(path, heading, lines, snaps, images, empty_note, dpi,
+                                progress=task.signals.progress.emit)
+          return {"path": path, "caption": caption, "figs": figs, "keys": keys, "rendered": rendered,
+                  "synthesized": {id(fig) for fig in synthesized}}
+
+      task = _PdfExportTask(job)
+      task.signals.finished.connect(self._on_pdf_export_finished, Qt.QueuedConnection)
+      task.signals.failed.connect(self._on_pdf_export_failed, Qt.QueuedConnection)
+      task.signals.progress.connect(self._on_pdf_export_progress, Qt.QueuedConnection)
+      self._pdf_tasks.add(task)
+      QThreadPool.globalInstance().start(task)
+      self.statusBar().showMessage("Exporting PDF…", 2000)
+
+  @Slot(object, object)
+  def _on_pdf_export_finished(self, task, payload):
+      self._pdf_tasks.discard(task)
+      figs, keys = payload["figs"], payload["keys"]
+      for i, fig in enumerate(figs):
+          if id(fig) in payload["synthesized"]:
+              # Synthesized for this report only; nothing on screen references it
+              fig.clf()
+          elif i in payload["rendered"]:
+              self._img_cache[fig] = (keys[i], payload["rendered"][i])
+      QMessageBox.information(self, payload["caption"], f"Saved: {payload['path']}")
+
+  @Slot(int, int)
+  def _on_pdf_export_progress(self, done, total):
+      self.statusBar().showMessage(f"Exporting PDF… page {done} of {total}", 2000)
+
+  @Slot(object, str)
+  def _on_pdf_export_failed(self, task, err):
+      self._pdf_tasks.discard(task)
+      QMessageBox.critical(self, "Save Failed", f"Could not save PDF:\n{err}")
+
+  def _show_export_menu(self, widget: QWidget, kind: str, pos: QPoint):
       menu = QMenu(widget)
       if kind == "lateral":
           a_csv = menu.addAction("Export Lateral CSV")
@@ -1396,16 +1942,13 @@ class MainWindow(QMainWindow):
       
 
   #---------Export Handlers------------
+  @Slot()
   def export_axial_csv(self):
       if not self.last_axial_results:
           QMessageBox.information(self, "No results", "Run an axial analysis first.")
           return
       
       results = self.last_axial_results
-      df = pd.DataFrame({
-          'Loads_kN': results['loads_kN'],
-          'Settlement_m': results['settlements_m']
-      })
 
       csv_path, _ = QFileDialog.getSaveFileName(self, "Save Axial Curve CSV", "axial_curve.csv", "CSV (*.csv)")
       if not csv_path:
@@ -1413,12 +1956,19 @@ class MainWindow(QMainWindow):
       if not csv_path.lower().endswith(".csv"):
           csv_path += ".csv"
 
+      table = np.column_stack((
+          np.asarray(results['loads_kN'], dtype=np.float64),
+          np.asarray(results['settlements_m'], dtype=np.float64),
+      ))
+
       try:
-          df.to_csv(csv_path, index=False)
+          with open(csv_path, "wb", buffering=1 << 20) as f:
+              np.savetxt(f, table, fmt="%.17g", delimiter=",", header="Loads_kN,Settlement_m", comments="")
           self.statusBar().showMessage(f"Saved: {csv_path}", 5000)
       except Exception as e:
           QMessageBox.critical(self, "Save Failed", f"could not save CSV:\n{e}")
 
+  @Slot()
   def export_lateral_csv(self):
     if not getattr(self, "last_lateral_out", None):
         QMessageBox.information(self, "Export Lateral CSV", "Run Lateral Analysis First.")
@@ -1430,74 +1980,72 @@ class MainWindow(QMainWindow):
         QMessageBox.information(self, "Export Lateral CSV", "No step results to export.")
         return
     
-    def _get(step, key, default=None):
-        if isinstance(step, dict):
-            return step.get(key, default)
-        return getattr(step, key, default)
-
     # last step arrays
     last = steps[-1]
-    z = np.asarray(getattr(last, "z_m", []), dtype=float)
-    y = np.asarray(getattr(last, "y_m", []), dtype=float)
-    slope = np.asarray(getattr(last, "theta_rad", []), dtype=float)
-    M = np.asarray(getattr(last, "M_Nm", []), dtype=float)
-    V = np.asarray(getattr(last, "V_N", []), dtype=float)
-    p = np.asarray(getattr(last, "p_N_per_m", []), dtype=float)
+    z = _as_f64_view(getattr(last, "z_m", []))
+    y = _as_f64_view(getattr(last, "y_m", []))
+    slope = _as_f64_view(getattr(last, "theta_rad", []))
+    M = _as_f64_view(getattr(last, "M_Nm", []))
+    V = _as_f64_view(getattr(last, "V_N", []))
+    p = _as_f64_view(getattr(last, "p_N_per_m", []))
 
     if z.size == 0:
         QMessageBox.critical(self, "Export Lateral CSV", "Solver returned no depth array. Re-run analysis")
         return
 
-    def _clean(a, n_ref):
-        a = np.asarray(a, dtype=float).reshape(-1)
-        if a.size != n_ref:
-            out = np.zeros(n_ref, dtype=float)
-            out[:min(a.size, n_ref)] = a[:min(a.size, n_ref)]
-            a = out
-        return np.nan_to_num(a, nan=0.0, posinf=0.0, neginf=0.0)
-    
-
+    # One buffer holding every CSV column so padding and NaN/inf cleanup
+    # happen in a single pass and the matrix can be written out directly.
+    headers = (
+        "Depth_m", "Deflection_m", "Slope_rad", "Curvature_1_per_m",
+        "Moment_Nm", "Shear_N", "SoilReaction_N_per_m",
+    )
     n = z.size
-    y = _clean(y, n)
-    slope = _clean(slope, n)
-    M = _clean(M, n)
-    V = _clean(V, n)
-    p = _clean(p, n)
+    # Every cell is written below (column 3 by the divide), so skip the zero-fill
+    cols = np.empty((n, len(headers)), dtype=np.float64)
+    for k, src in ((0, z), (1, y), (2, slope), (4, M), (5, V), (6, p)):
+        m = min(src.size, n)
+        cols[:m, k] = src[:m]
+        cols[m:, k] = 0.0
 
     # EI for curvature calculation
-    EI = float(out.get("meta", {}).get("EI_Nm2", 0.0))
+    EI = self._get_EI()
     if not np.isfinite(EI) or EI <= 0.0:
-        # fallback from current pile if meta is missing
-        pile = (self.project or {}).get("pile", {})
-        D = float(pile.get("diameter_m", 0.0))
-        E = float(pile.get("elastic_modulus_pa", 0.0))
-        I = (np.pi * (D ** 4)) / 64.0 if D > 0 else 0.0
-        EI = E * I if (E > 0 and I > 0) else 1.0
-
-    curvature = np.nan_to_num(M / EI, nan=0.0, posinf=0.0, neginf=0.0)
-
-    df = pd.DataFrame({
-        "Depth_m": z,
-        "Deflection_m": y,
-        "Slope_rad": slope,
-        "Curvature_1_per_m": curvature,
-        "Moment_Nm": M,
-        "Shear_N": V,
-        "SoilReaction_N_per_m": p,
-    })
-
-    path, _ = QFileDialog.getSaveFileName(self, "Save Lateral Results CSV", "lateral_results_csv", "CSV (*.csv)")
+        EI = 1.0
+
+    np.divide(cols[:, 4], EI, out=cols[:, 3])
+    np.nan_to_num(cols, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+
+    # Feather/Parquet need pandas + pyarrow, which are optional; offer them only when importable
+    columnar = find_spec("pandas") is not None and find_spec("pyarrow") is not None
+    filters = "CSV (*.csv);;Feather (*.feather);;Parquet (*.parquet)" if columnar else "CSV (*.csv)"
+    path, selected = QFileDialog.getSaveFileName(
+        self, "Save Lateral Results", "lateral_results", filters
+    )
     if not path:
         return
-    if not path.lower().endswith(".csv"):
-        path += ".csv"
+    # A typed suffix picks the format; otherwise the selected filter does
+    ext = pathlib.Path(path).suffix.lower()
+    if ext not in ((".csv", ".feather", ".parquet") if columnar else (".csv",)):
+        ext = ".feather" if selected.startswith("Feather") else ".parquet" if selected.startswith("Parquet") else ".csv"
+        path += ext
 
     try:
-        df.to_csv(path, index=False)
+        if ext == ".csv":
+            with open(path, "wb", buffering=1 << 20) as f:
+                np.savetxt(f, cols, fmt="%.17g", delimiter=",", header=",".join(headers), comments="")
+        else:
+            import pandas as pd
+
+            df = pd.DataFrame({h: cols[:, k] for k, h in enumerate(headers)}, copy=False)
+            if ext == ".feather":
+                df.to_feather(path, compression="uncompressed")
+            else:
+                df.to_parquet(path, compression="snappy")
         self.statusBar().showMessage(f"Saved: {path}", 5000)
     except Exception as e:
-        QMessageBox.critical(self, "Save Failed", f"Could not save CSV:\n{e}")
+        QMessageBox.critical(self, "Save Failed", f"Could not save results:\n{e}")
 
+  @Slot()
   def export_axial_pdf(self):
       if not getattr(self, "last_axial_results", None):
           QMessageBox.warning(self, "Export Axial PDF", "Run Axial Analysis first.")
@@ -1508,79 +2056,14 @@ class MainWindow(QMainWindow):
       path, _ = QFileDialog.getSaveFileName(self, "Save Axial PDF", default_name, "PDF Files (*.pdf)")
       if not path:
           return
-      
-      c = rl_canvas.Canvas(path, pagesize=letter)
-      width, height = letter
-      margin = 0.75 * inch
-      cursor_y = height - margin
-
-      # Header
-      c.setFont("Helvetica-Bold", 14)
-      c.drawString(margin, cursor_y, "Axial Load-Settlement Analysis")
-      cursor_y -= 18
-
-      # Text helper
-      c.setFont("Helvetica", 10)
-      def line(txt):
-          nonlocal cursor_y
-          c.drawString(margin, cursor_y, txt)
-          cursor_y -= 12
-
-      # Gather inputs
-      meta = self.project.get("meta", {})
-      pile = self.project.get("pile", {})
-      loads = self.project.get("loads", {})
-      layers = self.project.get("soil_profile", [])
-
-      units = meta.get("units", "SI")
-
-      E = pile.get("elastic_modulus_pa")
-      E_txt = f"{E/1e9:.2f} GPa" if E else "-"
-      gamma = pile.get("unit_weight_kNpm3", "-")
-
-      moment_kNm = loads.get("moment_kNm", loads.get("moment_kN", "-"))
-
-      # Inputs summary
-      line(f"Units: {units}")
-      line(
-          f"Pile: L = {pile.get('length_m', '-')} m, "
-          f"D = {pile.get('diameter_m', '-')} m, "
-          f"E = {E_txt}, "
-          f"γ = {gamma} kN/m³"
-      )
-      line (
-          f"Loads: Axial = {loads.get('axial_kN', '-')} kN, "
-          f"Lateral = {loads.get('lateral_kN', '-')} kN, "
-          f"Moment = {moment_kNm} kN.m"
-      )
-
-      # Soil layers
-      if layers:
-          line("Soil Layers:")
-          for i, L in enumerate(layers, 1):
-              soil_type = (L.get("type") or "?").title()
-              gL = L.get("gamma_kNpm3", "-")
-              if L.get("type") == "clay":
-                  strength = f"su = {L.get('undrained_shear_strength_kPa', '-')} kPa"
-              else:
-                  strength = f"φ = {L.get('phi_deg', '-')}°"
-              line(
-                  f" {i}) {soil_type}, "
-                  f"{L.get('from_m', '?')}-{L.get('to_m', '?')} m, "
-                  f"γ = {gL} kN/m³, {strength}"
-              )
-      else:
-          line("Soil Layers: (none defined)")
-
-      cursor_y -= 4
-      line("Notes: Results generated from the project inputs listed above.")
-      cursor_y -= 10
 
       # Draw axial figures captured during run
       figs = list(getattr(self, "_axial_figures", []))
+      synthesized = []
       if not figs:
           try:
-              fig, ax = plt.subplots(figsize=(6,4))
+              fig = _agg_figure()
+              ax = fig.add_subplot(111)
               s = self.last_axial_results.get("settlements_m", [])
               q = self.last_axial_results.get("loads_kN", [])
               # Convert settlement to mm for a nice axis
@@ -1590,53 +2073,16 @@ class MainWindow(QMainWindow):
               ax.set_ylabel("Load Q (kN)")
               ax.set_title("Q-s Curve")
               ax.grid(True)
-              figs = [fig]
+              figs = synthesized = [fig]
           except Exception:
               pass
           
-      if not figs:
-          cursor_y -= 14
-          c.setFont("Helvetica-Oblique", 10)
-          c.drawString(margin, cursor_y, "No plots were generated; run Axial Analysis to generate curves")
-          c.showPage()
-          c.save()
-          QMessageBox.information(self, "Export Axial PDF", f"Saved: {path}")
-          return
-      
-      # Layout: one figure per page (scaled to fit within margins)
-      max_plot_w = width - 2 * margin
-      max_plot_h = height - 2 * margin - 80
-      for idx, fig in enumerate(figs, start=1):
-          # Start a new page for each figure except the first
-          if idx > 1:
-              c.showPage()
-              cursor_y = height - margin
-              c.setFont("Helvetica-Bold", 14)
-              c.drawString(margin, cursor_y, "Axial Load-Settlement Analsysis")
-              cursor_y -= 24
-
-          img = self._figure_to_imagereader(fig, dpi=220)
-
-          # Compute image aspect and scale to fit
-          iw, ih = fig.get_size_inches()
-          aspect = (ih / iw)
-          draw_w = max_plot_w
-          draw_h = draw_w * aspect
-          if draw_h > max_plot_h:
-              draw_h = max_plot_h
-              draw_w = draw_h / aspect
-
-          x = margin + (max_plot_w - draw_w) / 2.0
-          y = margin + (max_plot_h - draw_h) / 2.0
-
-          c.drawImage(img, x, y, width=draw_w, height=draw_h, preserveAspectRatio=True, anchor='c')
-    
-      c.showPage()
-      c.save()
-      
-      QMessageBox.information(self, "Export Axial PDF", f"Saved: {path}")
+      self._start_pdf_export(path, "Export Axial PDF", "Axial Load-Settlement Analysis", figs,
+                             "No plots were generated; run Axial Analysis to generate curves",
+                             synthesized=synthesized)
 
 
+  @Slot()
   def export_lateral_pdf(self):
       if not getattr(self, "last_lateral_out", None):
           QMessageBox.warning(self, "Export Lateral PDF", "Run Lateral Analysis first.")
@@ -1645,173 +2091,79 @@ class MainWindow(QMainWindow):
       path, _ = QFileDialog.getSaveFileName(self, "Save Lateral PDF", "lateral_analysis.pdf", "PDF (*.pdf)")
       if not path:
           return
-      
-      c = rl_canvas.Canvas(path, pagesize=letter)
-      width, height = letter
-      margin = 0.75 * inch
-      cursor_y = height - margin
-
-      # Header
-      c.setFont("Helvetica-Bold", 14)
-      c.drawString(margin, cursor_y, "Lateral Analysis Report")
-      cursor_y -= 18
-
-      # Text Helper
-      c.setFont("Helvetica", 10)
-      def line(txt):
-          nonlocal cursor_y
-          c.drawString(margin, cursor_y, txt)
-          cursor_y -= 12
-
-      # Gather inputs
-      meta = self.project.get("meta", {})
-      pile = self.project.get("pile", {})
-      loads = self.project.get("loads", {})
-      layers = self.project.get("soil_profile", [])
-
-      units = meta.get("units", "SI")
-
-      E = pile.get("elastic_modulus_pa")
-      E_txt = f"{E/1e9:.2f} GPa" if E else "-"
-      gamma = pile.get("unit_weight_kNpm3", "-")
-
-      moment_kNm = loads.get("moment_kNm", loads.get("moment_kN", "-"))
-
-      # Inputs summary
-      line(f"Units: {units}")
-      line(
-          f"Pile: L = {pile.get('length_m', '-')} m, "
-          f"D = {pile.get('diameter_m', '-')} m, "
-          f"E = {E_txt}, "
-          f"γ = {gamma} kN/m³"
-      )
-      line (
-          f"Loads: Axial = {loads.get('axial_kN', '-')} kN, "
-          f"Lateral = {loads.get('lateral_kN', '-')} kN, "
-          f"Moment = {moment_kNm} kN.m"
-      )
-
-      # Soil layers
-      if layers:
-          line("Soil Layers:")
-          for i, L in enumerate(layers, 1):
-              soil_type = (L.get("type") or "?").title()
-              gL = L.get("gamma_kNpm3", "-") 
-              if L.get("type") == "clay":
-                  strength = f"su = {L.get('undrained_shear_strength_kPa', '-')} kPa"
-              else:
-                  strength = f"φ = {L.get('phi_deg', '-')}°"
-              line(
-                  f" {i}) {soil_type}, "
-                  f"{L.get('from_m', '?')}-{L.get('to_m', '?')} m, "
-                  f"γ = {gL} kN/m³, {strength}"
-              )
-      else:
-          line("Soil Layers: (none defined)")
-
-      cursor_y -= 4
-      line("Notes: Results generated from the project inputs listed above.")
-      cursor_y -= 10
-
 
       # Figures captured during lateral analysis
       figs = list(getattr(self, "_lateral_figures", []))
 
-      # If none captured, synthesize key plots from last step
+      # If none captured, synthesize key plots from last step. They are kept until the
+      # next analysis, so repeat exports reuse the same figures and their cached images.
       if not figs and self.last_lateral_out.get("steps"):
-          last = self.last_lateral_out["steps"][-1]
-          z = np.asarray(last.z_m, dtype=float)
-          y = np.asarray(last.y_m, dtype=float)
-
-          # H-y (head) curve if present
-          pairs = self.last_lateral_out.get("head_curve", [])
-          if pairs:
-              figHy, axHy = plt.subplots(figsize=(6, 4))
-              H_kN = np.array([h for (h, y0) in pairs]) / 1e3
-              y_mm = np.array([y0 for (h, y0) in pairs]) * 1e3
-              axHy.plot(y_mm, H_kN, marker="o")
-              axHy.set_xlabel("Head Deflection (mm)")
-              axHy.set_ylabel("Head Load H (kN)")
-              axHy.set_title("Lateral H-y")
-              axHy.grid(True)
-              figs.append(figHy)
-
-          # Deflection, Moment, Shear
-          if z.size >= 3:
-              dz = float(np.mean(np.diff(z)))
-              dy_dz = np.gradient(y, dz)
-              d2y_dz2 = np.gradient(dy_dz, dz)
-              D = float(pile.get("diameter_m", 0.0))
-              E = float(pile.get("elastic_modulus_pa", 0.0))
-              I = 3.14159265358979 * (D ** 4) / 64.0
-              EI = E * I
-              M = -EI * d2y_dz2
-              V = np.gradient(M, dz)
-
-              figDefl, axDefl = plt.subplots(figsize=(6,4))
-              axDefl.plot(y * 1e3, z)
-              axDefl.invert_yaxis()
-              axDefl.set_xlabel("Deflection (mm)")
-              axDefl.set_ylabel("Depth (m)")
-              axDefl.set_title("Deflection vs Depth")
-              axDefl.grid(True)
-              figs.append(figDefl)
-
-              figM, axM = plt.subplots(figsize=(6,4))
-              axM.plot(M / 1e3, z)
-              axM.invert_yaxis()
-              axM.set_xlabel("Moment (kN.m)")
-              axM.set_ylabel("Depth (m)")
-              axM.set_title("Moment vs Depth")
-              axM.grid(True)
-              figs.append(figM)
-
-              figV, axV = plt.subplots(figsize=(6, 4))
-              axV.plot(V / 1e3, z)
-              axV.invert_yaxis()
-              axV.set_xlabel("Shear (kN)")
-              axV.set_ylabel("Depth (m)")
-              axV.set_title("Shear vs Depth")
-              axV.grid(True)
-              figs.append(figV)
-
-      if not figs:
-        cursor_y -= 14
-        c.setFont("Helvetica-Oblique", 10)
-        c.drawString(margin, cursor_y, "No plots were generated. Run Lateral Analysis to generate curves.")
-        c.showPage()
-        c.save()
-        QMessageBox.information(self, "Export Lateral PDF", f"Saved: {path}")
-        return
-      
-      # draw figures (one per page)
-      max_plot_w = width - 2 * margin
-      max_plot_h = height - 2 * margin - 80
-
-      for idx, fig in enumerate(figs, start=1):
-          if idx > 1:
-              c.showPage()
-              cursor_y = height - margin
-              c.setFont("Helvetica-Bold", 14)
-              c.drawString(margin, cursor_y, "Lateral Analysis Report")
-              cursor_y -= 24
-
-          img = self._figure_to_imagereader(fig, dpi=220)
-          iw, ih = fig.get_size_inches()
-          aspect = ih / iw
-          draw_w = max_plot_w
-          draw_h = draw_w * aspect
-          if draw_h > max_plot_h:
-              draw_h = max_plot_h
-              draw_w = draw_h / aspect
-
-          x = margin + (max_plot_w - draw_w) / 2.0
-          y = margin + (max_plot_h - draw_h) / 2.0
-          c.drawImage(img, x, y, width=draw_w, height=draw_h, preserveAspectRatio=True)
-
-      c.showPage()
-      c.save()
-      QMessageBox.information(self, "Export Lateral PDF", f"Saved: {path}")
+          cached = self._lateral_pdf_figs
+          if cached is not None and cached[0] is self.last_lateral_out:
+              figs = list(cached[1])
+          else:
+              last = self.last_lateral_out["steps"][-1]
+              z = _as_f64_view(last.z_m)
+              y = _as_f64_view(last.y_m)
+
+              # H-y (head) curve if present
+              pairs = self.last_lateral_out.get("head_curve", [])
+              if pairs:
+                  figHy = _agg_figure()
+                  axHy = figHy.add_subplot(111)
+                  hy = np.asarray(pairs, dtype=np.float64)
+                  H_kN = hy[:, 0] * 1e-3
+                  y_mm = hy[:, 1] * 1e3
+                  axHy.plot(y_mm, H_kN, marker="o")
+                  axHy.set_xlabel("Head Deflection (mm)")
+                  axHy.set_ylabel("Head Load H (kN)")
+                  axHy.set_title("Lateral H-y")
+                  axHy.grid(True)
+                  figs.append(figHy)
+
+              # Deflection, Moment, Shear
+              if z.size >= 3:
+                  # Reuse the plotting-unit arrays converted when this step was run
+                  conv = self.last_lateral_arrays
+                  if conv is not None and conv["z"] is last.z_m:
+                      y_mm, M_kNm, V_kN = conv["y_mm"], conv["M_kNm"], conv["V_kN"]
+                  else:
+                      # Prefer the solver's moment/shear; differentiate y only if they are missing
+                      M = _as_f64_view(getattr(last, "M_Nm", []))
+                      V = _as_f64_view(getattr(last, "V_N", []))
+                      if M.size != z.size or V.size != z.size:
+                          dz = float(np.mean(np.diff(z)))
+                          M, V = _moment_shear(y, dz, self._get_EI())
+                      y_mm, M_kNm, V_kN = y * 1e3, M * 1e-3, V * 1e-3
+
+                  figDefl = _agg_figure()
+                  axDefl = figDefl.add_subplot(111)
+                  axDefl.plot(y_mm, z)
+                  axDefl.invert_yaxis()
+                  axDefl.set_xlabel("Deflection (mm)")
+                  axDefl.set_ylabel("Depth (m)")
+                  axDefl.set_title("Deflection vs Depth")
+                  axDefl.grid(True)
+                  figs.append(figDefl)
+
+                  # Moment and shear share the depth axis, so they go side by side on one figure/page
+                  figMV = _agg_figure(figsize=(10, 4))
+                  axM, axV = figMV.subplots(1, 2, sharey=True)
+                  axM.plot(M_kNm, z)
+                  axM.invert_yaxis()
+                  axM.set_xlabel("Moment (kN.m)")
+                  axM.set_ylabel("Depth (m)")
+                  axM.set_title("Moment vs Depth")
+                  axM.grid(True)
+                  axV.plot(V_kN, z)
+                  axV.set_xlabel("Shear (kN)")
+                  axV.set_title("Shear vs Depth")
+                  axV.grid(True)
+                  figs.append(figMV)
+              self._lateral_pdf_figs = (self.last_lateral_out, list(figs))
+
+      self._start_pdf_export(path, "Export Lateral PDF", "Lateral Analysis Report", figs,
+                             "No plots were generated. Run Lateral Analysis to generate curves.")
 
 
       
@@ -1821,34 +2173,50 @@ class MainWindow(QMainWindow):
       if self.project is None:
           self.new_project()
 
+  def _schedule_refresh(self):
+      """Coalesce refresh_ui requests from one user action into a single pass on the next event-loop turn."""
+      if not self._refresh_pending:
+          self._refresh_pending = True
+          QTimer.singleShot(0, self._do_scheduled_refresh)
+
+  @Slot()
+  def _do_scheduled_refresh(self):
+      self._refresh_pending = False
+      self.refresh_ui()
+
+  @Slot()
   def edit_pile(self):
       self._ensure_project()
       dlg = PileDialog(self.project.get("pile", {}), self)
       if dlg.exec():
           try:
             self.project["pile"] = dlg.result_data()
-            self.refresh_ui()
+            self._ei_cache = None
+            self._3d_dirty = True
+            self._schedule_refresh()
             self._set_dirty(True)
           except ValueError as e:
               QMessageBox.critical(self, "Input Error", str(e))
 
+  @Slot()
   def edit_loads(self):
       self._ensure_project()
       dlg = LoadDialog(self.project.get("loads", {}), self)
       if dlg.exec():
           self.project["loads"] = dlg.result_data()
-          self.refresh_ui()
+          self._schedule_refresh()
           self._set_dirty(True)
 
+  @Slot()
   def add_soil_layer(self):
       self._ensure_project()
       dlg = SoilLayerDialog(parent=self)
       if dlg.exec():
           layer = dlg.result_data()
-          self.project.setdefault("soil_profile", []).append(layer)
-          # keeping layers ordered by start depth
-          self.project["soil_profile"].sort(key=lambda L: L.get("from_m", 0.0))
-          self.refresh_ui()
+          # the profile is kept ordered by start depth, so insert in place
+          insort(self.project.setdefault("soil_profile", []), layer, key=_layer_top)
+          self._rebuild_soa()
+          self._schedule_refresh()
           self._set_dirty(True)
 
   def edit_soil_layer(self, index: int):
@@ -1863,9 +2231,10 @@ class MainWindow(QMainWindow):
       dlg = SoilLayerDialog(current_layer, self)
       if dlg.exec():
           new_layer = dlg.result_data()
-          layers[index] = new_layer
-          layers.sort(key=lambda L: L.get("from_m", 0.0))
-          self.refresh_ui()
+          del layers[index]
+          insort(layers, new_layer, key=_layer_top)
+          self._rebuild_soa()
+          self._schedule_refresh()
           self._set_dirty(True)
 
   def delete_soil_layer(self, index: int):
@@ -1888,34 +2257,105 @@ class MainWindow(QMainWindow):
           return
       
       layers.pop(index)
-      self.refresh_ui()
+      self._rebuild_soa()
+      self._schedule_refresh()
       self._set_dirty(True)
     
   def closeEvent(self, e):
-      s = QSettings("Pile Analysis", "StudentEdition")
-      s.setValue("win/geo", self.saveGeometry())
-      s.setValue("win/state", self.saveState(1))
+      s = self._settings
+      # Only touch the store when the layout moved, so an unchanged close does no disk/registry write
+      for key, value in (("win/geo", self.saveGeometry()), ("win/state", self.saveState(1))):
+          if s.value(key) != value:
+              s.setValue(key, value)
+      # Recent-file changes are batched in memory for the whole session
+      if self._recent_dirty:
+          s.setValue("recent_files", self._recent_cache)
+          self._recent_dirty = False
+      s.sync()
       super().closeEvent(e)
 
+  @Slot(int)
   def _close_plot_tab(self, index: int):
       w = self.plot_area.widget(index)
       self.plot_area.removeTab(index)
       if w is not None:
-          w.deleteLater()
+          for key in [k for k, v in self._curve_cache.items() if v[-1] is w]:
+              del self._curve_cache[key]
+          self._release_tab(w)
+
+  def _clear_plot_tabs(self, keep=frozenset()):
+      """Remove every plot tab and release it; tabs in keep are only detached for reuse."""
+      # Stop a curve preview still adding one tab per tick; its specs belong to the old tabs
+      self._curve_gen += 1
+      self._curve_specs = iter(())
+      # Blocked so removing the current tab does not build a deferred tab about to be released
+      blocker = QSignalBlocker(self.plot_area)
+      for index in reversed(range(self.plot_area.count())):
+          if self.plot_area.widget(index) in keep:
+              self.plot_area.removeTab(index)
+          else:
+              self._close_plot_tab(index)
+      blocker.unblock()
+
+  def _acquire_fig(self, figsize, constrained: bool = False) -> Figure:
+      """Figure from the pool of closed tabs, or a new one if the pool is empty."""
+      if self._fig_pool:
+          fig = self._fig_pool.pop()
+          fig.set_size_inches(figsize)
+      else:
+          fig = Figure(figsize=figsize)
+      fig.set_layout_engine("constrained" if constrained else "none")
+      return fig
+
+  def _add_deferred_plot_tab(self, fig, title: str, fill) -> QWidget:
+      """Add an empty tab for fig; fill(tab, fig) builds its widgets the first time it is shown."""
+      tab = QWidget()
+      # Registered before addTab: adding to an empty tab widget makes it current immediately
+      self._pending_tabs[tab] = (fig, fill)
+      self.plot_area.addTab(tab, title)
+      return tab
+
+  @Slot(int)
+  def _on_plot_tab_changed(self, index: int):
+      tab = self.plot_area.widget(index)
+      entry = self._pending_tabs.pop(tab, None)
+      if entry is not None:
+          fig, fill = entry
+          fill(tab, fig)
+
+  def _release_tab(self, w: QWidget):
+      """Delete a plot tab widget and return its figures to the pool."""
+      if self._ls_plot is not None and self._ls_plot[-1] is w:
+          self._ls_plot = self._ls_bg = None
+      figs = [canvas.figure for canvas in w.findChildren(FigureCanvas)]
+      pending = self._pending_tabs.pop(w, None)
+      if pending is not None:
+          figs.append(pending[0])
+      for fig in figs:
+          self._img_cache.pop(fig, None)
+          for owned in (self._axial_figures, self._lateral_figures):
+              if fig in owned:
+                  owned.remove(fig)
+          fig.clf()
+          # Rebind to a bare canvas so the figure stops referencing the deleted Qt canvas
+          # and, through it, that canvas's Agg renderer buffer
+          FigureCanvasBase(fig)
+          if len(self._fig_pool) < 8:
+              self._fig_pool.append(fig)
+      w.deleteLater()
 
   def _add_plot_tab(self, fig, title: str):
       """Warap a Matplotlib fig with a canvas + toolbar and add as a tab"""
-      try:
-          fig.tight_layout()
-      except Exception:
-          pass
+      # Constrained layout runs as part of each draw; no separate tight_layout pass
+      if fig.get_layout_engine() is None:
+          fig.set_layout_engine("constrained")
       
-      canvas = FigureCanvas(fig)
+      canvas = _LazyCanvas(fig)
       wrap = QWidget()
       v = QVBoxLayout(wrap)
       v.setContentsMargins(6,6,6,6)
 
-      toolbar = NavigationToolbar(canvas, wrap)
+      toolbar = _LazyToolbar(canvas, wrap)
       v.addWidget(toolbar)
       v.addWidget(canvas)
 
@@ -1924,52 +2364,19 @@ class MainWindow(QMainWindow):
       return canvas, toolbar
   
   def _rebuild_layers_list(self):
-      """Fill left dock soil list with Edit/Delete buttons."""
-      if not hasattr(self, "layers_list"):
+      """Point the left dock soil list at the current soil profile."""
+      if self.layers_list is None:
           return
       
-      self.layers_list.clear()
       layers = (self.project or {}).get("soil_profile", [])
-
-      if not layers:
-          item = QListWidgetItem("(no soil layers)")
-          item.setFlags(Qt.NoItemFlags)
-          self.layers_list.addItem(item)
+      # Skip the model reset when the profile (same list, same contents) is unchanged
+      key = (id(layers), _profile_key(layers))
+      if key == self._layers_key:
           return
-      
-      for idx, layer in enumerate(layers):
-          row = QWidget()
-          h = QHBoxLayout(row)
-          h.setContentsMargins(6, 2, 6, 2)
-          h.setSpacing(6)
-
-          typ = (layer.get("type") or "soil").title()
-          z0 = layer.get("from_m", 0)
-          z1 = layer.get("to_m", 0)
-
-          lbl = QLabel(f"{idx+1}. {typ} ({z0:g}-{z1:g} m)")
-          lbl.setStyleSheet("font-size:12px;")
-
-          btn_edit = QToolButton()
-          btn_edit.setText("Edit")
-          btn_edit.setAutoRaise(True)
-          btn_edit.clicked.connect(lambda _=False, i=idx: self.edit_soil_layer(i))
-
-          btn_del = QToolButton()
-          btn_del.setText("Delete")
-          btn_del.setAutoRaise(True)
-          btn_del.clicked.connect(lambda _=False, i=idx: self.delete_soil_layer(i))
-
-          h.addWidget(lbl)
-          h.addStretch(1)
-          h.addWidget(btn_edit)
-          h.addWidget(btn_del)
-
-          item = QListWidgetItem()
-          item.setSizeHint(row.sizeHint())
-          self.layers_list.addItem(item)
-          self.layers_list.setItemWidget(item, row)
+      self._layers_key = key
+      self._layers_model.set_layers(layers)
 
+  @Slot(QUrl)
   def _on_summary_link_clicked(self, url: QUrl):
       """Handles clicks from Project Summary soil-layer actions."""
       if self.project is None:
@@ -1987,11 +2394,139 @@ class MainWindow(QMainWindow):
               self.delete_soil_layer(idx)
 
       except Exception as e:
-          print("summary link error:", e)
-
-      self.refresh_ui()
+          log.warning("summary link error: %s", e)
 
   #-----UI helper-------
+  # Per-layer row of the project summary table, filled by refresh_ui
+  _CLAY_STRENGTH_FMT = "su = {su} kPa"
+  _SAND_STRENGTH_FMT = "φ = {phi}°"
+  _LAYER_ROW_FMT = (
+      "<tr>"
+      "<td style='padding: 2px 18px 2px 0;'>{i}</td>"
+      "<td style='padding: 2px 18px 2px 0;'>{soil_type}</td>"
+      "<td style='padding: 2px 18px 2px 0;'>{a:g}-{b:g} m</td>"
+      "<td style='padding: 2px 18px 2px 0;'>{g:g} kN/m³</td>"
+      "<td style='padding: 2px 18px 2px 0;'>{strength}</td>"
+      "<td style='padding: 2px 0 2px 0;'>"
+      "<a href='edit-layer:{k}' style='"
+      "display: inline-block; padding: 2px 8px; border: 1px solid #777; border-radius: 6px;"
+      "text-decoration: none; font-size: 13px; margin-right: 10px;'>Edit</a>"
+      "&nbsp;&nbsp;&nbsp;"
+      "<a href='del-layer:{k}' style='"
+      "display: inline-block; padding: 2px 8px; border: 1px solid #b55; border-radius: 6px;"
+      "text-decoration: none; font-size: 13px; color: #b55;'>Delete</a>"
+      "</td>"
+      "</tr>"
+  )
+
+  def _layer_row_html(self, i: int, L: dict) -> str:
+      if L.get("type") == "clay":
+          soil_type = "Clay"
+          strength = self._CLAY_STRENGTH_FMT.format(su=L.get("undrained_shear_strength_kPa", 0))
+      else:
+          soil_type = "Sand"
+          strength = self._SAND_STRENGTH_FMT.format(phi=L.get("phi_deg", 0))
+      return self._LAYER_ROW_FMT.format(
+          i=i, k=i - 1, soil_type=soil_type, strength=strength,
+          a=L.get("from_m", 0), b=L.get("to_m", 0), g=L.get("gamma_kNpm3", 0),
+      )
+
+  # Summary colours per theme
+  _SUMMARY_PALETTES = MappingProxyType({
+      "light": MappingProxyType({
+          "fg": "#111827", "muted": "#555", "tip": "#888", "line_col": "#d0d7e2",
+          "header_col": "#2b6cb0", "box_bg": "#ffffff", "box_border": "#d0d7e2",
+      }),
+      "dark": MappingProxyType({
+          "fg": "#e9edf5", "muted": "#a6aec2", "tip": "#9aa4c7", "line_col": "#596073",
+          "header_col": "#8ab4ff", "box_bg": "#2f3340", "box_border": "#596073",
+      }),
+  })
+
+  def _summary_html(self, units, pile: dict, loads: dict, layers: list) -> str:
+      """Project summary shown in the info browser."""
+      pal = self._SUMMARY_PALETTES["dark" if getattr(self, "_current_theme", "light") == "dark" else "light"]
+      fg, muted, tip = pal["fg"], pal["muted"], pal["tip"]
+      line_col, header_col = pal["line_col"], pal["header_col"]
+
+      # Pile summary
+      if pile:
+          E = pile.get("elastic_modulus_pa")
+          E_txt = f"{E/1e9:.1f} GPa" if E else "-"
+          pile_text = (
+              f"L = {pile.get('length_m', '-')} m &nbsp;|&nbsp; "
+              f"D = {pile.get('diameter_m', '-')} m &nbsp;|&nbsp; "
+              f"E = {E_txt} &nbsp;|&nbsp; "
+              f"γ = {pile.get('unit_weight_kNpm3', '-')} kN/m³ &nbsp;|&nbsp;"
+          )
+      else:
+          pile_text = "<span style='color:#888;'>(not defined)</span>"
+
+      # Loads summary
+      if loads:
+          loads_text = (
+              f"Axial = {loads.get('axial_kN', 0)} kN &nbsp;|&nbsp; "
+              f"Lateral = {loads.get('lateral_kN', 0)} kN &nbsp;|&nbsp; "
+              f"Moment = {loads.get('moment_kNm', 0)} kN.m"
+          )
+      else:
+          loads_text = "<span style='color:#888;'>(not defined)</span>"
+
+      # Soil layers table (a list, so join sizes its buffer in one pass)
+      layer_rows = "".join([self._layer_row_html(i, L) for i, L in enumerate(layers, 1)])
+
+      layers_section = ""
+      if layers:
+          layers_section = f"""
+              <table style="border-collapse:collapse; margin-top: 8px; font-size: 16px;">
+                  <tr style="font-weight:600; color:{muted};">
+                      <th align="left" style="padding: 0 18px 4px 0;">#</th>
+                      <th align="left" style="padding: 0 18px 4px 0;">Type</th>
+                      <th align="left" style="padding: 0 18px 4px 0;">Depth</th>
+                      <th align="left" style="padding: 0 18px 4px 0;">γ</th>    
+                      <th align="left" style="padding: 0 18px 4px 0;">Strength</th>
+                      <th align="left">Actions</th>
+                  </tr>
+                  {layer_rows}
+              </table>"""
+
+      box_bg, box_border = pal["box_bg"], pal["box_border"]
+
+      html = f"""
+          <div style="color:{fg}; background: {box_bg}; border: 1px solid {box_border}; border-radius: 1opx; padding: 10px;">
+              <div style="font-size: 13px; font-weight: 600; letter-spacing: 0.5px; color: {header_col}; margin-bottom: 2px;">
+                  Project Summary
+              </div>
+              <div style="height: 1px; background: {line_col}; margin-bottom: 6px;"></div>
+
+              <table style="border-collapse: collapse; margin: 4px 0 8px 0; font-size: 16px; color: {fg};">
+                  <tr>
+                      <th align="left" style="padding: 4px 18px 4px 0; color: {muted};">Units</th>
+                      <td style="padding: 4px 0;">{units}</td>
+                  </tr>
+                  <tr>
+                      <th align="left" style="padding: 4px 18px 4px 0; color: {muted};">Pile</th>
+                      <td style="padding: 4px 0;">{pile_text}</td>
+                  </tr>
+                  <tr>
+                      <th align="left" style="padding: 4px 18px 4px 0; color: {muted};">Loads</th>
+                      <td style="padding: 4px 0;">{loads_text}</td>
+                  </tr>
+                  <tr>
+                      <th align="left" style="padding: 4px 18px 4px 0; color: {muted};">Soil Layers</th>
+                      <td style="padding: 4px 0;">{len(layers)} defined</td>
+                  </tr>
+              </table>
+
+              {layers_section}
+
+              <p style="margin-top: 6px; color: {tip}; font-size: 16px;">
+                  Tip: Use the Edit Controls to update inputs.
+                  Drag &amp; drop a <code>.pile.json</code> file anywhere to open an existing project.
+              </p>
+          </div>"""
+      return html
+
   def refresh_ui(self):
             if self.project is None:
               self.info.hide()
@@ -1999,8 +2534,11 @@ class MainWindow(QMainWindow):
               self.btn_gen.hide()
               self.welcome.show()
               self._lbl_meta.setText("No Projects Loaded.")
-              if hasattr(self, "layers_list"):
-                  self.layers_list.clear()
+              self._summary_key = None
+              self._last_html = None
+              if self.layers_list is not None:
+                  self._layers_key = None
+                  self._layers_model.set_layers([])
               return
             
             # existing summary
@@ -2016,13 +2554,6 @@ class MainWindow(QMainWindow):
             loads = self.project.get("loads", {})
             layers = self.project.get("soil_profile", [])
             
-            is_dark = getattr(self, "_current_theme", "light") == "dark"
-            fg = "#e9edf5" if is_dark else "#111827"
-            muted = "#a6aec2" if is_dark else "#555"
-            tip = "#9aa4c7" if is_dark else "#888"
-            line_col = "#596073" if is_dark else "#d0d7e2"
-            header_col = "#8ab4ff" if is_dark else "#2b6cb0"
-
             self._lbl_meta.setText(
                 f"<b>Units</b>: {meta.get('units', 'SI')}<br>"
                 f"<b>Pile</b>: {('✓' if pile else '—')} &nbsp; "
@@ -2030,155 +2561,30 @@ class MainWindow(QMainWindow):
                 f"<b>Layers</b>: {len(layers)}"
             )
 
-            # Pile summary
-            if pile:
-                E = pile.get("elastic_modulus_pa")
-                E_txt = f"{E/1e9:.1f} GPa" if E else "-"
-                pile_text = (
-                    f"L = {pile.get('length_m', '-')} m &nbsp;|&nbsp; "
-                    f"D = {pile.get('diameter_m', '-')} m &nbsp;|&nbsp; "
-                    f"E = {E_txt} &nbsp;|&nbsp; "
-                    f"γ = {pile.get('unit_weight_kNpm3', '-')} kN/m³ &nbsp;|&nbsp;"
-                )
-            else:
-                pile_text = "<span style='color:#888;'>(not defined)</span>"
-
-            # Loads summary
-            if loads:
-                loads_text = (
-                    f"Axial = {loads.get('axial_kN', 0)} kN &nbsp;|&nbsp; "
-                    f"Lateral = {loads.get('lateral_kN', 0)} kN &nbsp;|&nbsp; "
-                    f"Moment = {loads.get('moment_kNm', 0)} kN.m"
-                )
-            else:
-                loads_text = "<span style='color:#888;'>(not defined)</span>"
-
-            # Soil layers table
-            layer_rows = ""
-            for i, L in enumerate(layers, 1):
-                if L.get("type") == "clay":
-                    soil_type = "Clay"
-                    strength = f"su = {L.get('undrained_shear_strength_kPa', 0)} kPa"
-                else:
-                    soil_type = "Sand"
-                    strength = f"φ = {L.get('phi_deg', 0)}°"  
-
-                actions_html = (
-                    f"<a href='edit-layer:{i-1}' style='"
-                    "display: inline-block; padding: 2px 8px; border: 1px solid #777; border-radius: 6px;"
-                    "text-decoration: none; font-size: 13px; margin-right: 10px;'>Edit</a>"
-                    "&nbsp;&nbsp;&nbsp;"
-                    f"<a href='del-layer:{i-1}' style='"
-                    "display: inline-block; padding: 2px 8px; border: 1px solid #b55; border-radius: 6px;"
-                    "text-decoration: none; font-size: 13px; color: #b55;'>Delete</a>"
-                )
-
-                layer_rows += (
-                    "<tr>"
-                    f"<td style='padding: 2px 18px 2px 0;'>{i}</td>"
-                    f"<td style='padding: 2px 18px 2px 0;'>{soil_type}</td>"
-                    f"<td style='padding: 2px 18px 2px 0;'>{L.get('from_m', 0):g}-{L.get('to_m', 0):g} m</td>"
-                    f"<td style='padding: 2px 18px 2px 0;'>{L.get('gamma_kNpm3', 0):g} kN/m³</td>"
-                    f"<td style='padding: 2px 18px 2px 0;'>{strength}</td>"
-                    f"<td style='padding: 2px 0 2px 0;'>{actions_html}</td>"
-                    "</tr>"
-                )    
-
-            layers_section = ""
-            if layers:
-                layers_section = f"""
-                    <table style="border-collapse:collapse; margin-top: 8px; font-size: 16px;">
-                        <tr style="font-weight:600; color:{muted};">
-                            <th align="left" style="padding: 0 18px 4px 0;">#</th>
-                            <th align="left" style="padding: 0 18px 4px 0;">Type</th>
-                            <th align="left" style="padding: 0 18px 4px 0;">Depth</th>
-                            <th align="left" style="padding: 0 18px 4px 0;">γ</th>    
-                            <th align="left" style="padding: 0 18px 4px 0;">Strength</th>
-                            <th align="left">Actions</th>
-                        </tr>
-                        {layer_rows}
-                    </table>"""
-            
-            box_bg = "#2f3340" if is_dark else "#ffffff"
-            box_border = "#596073" if is_dark else "#d0d7e2"
-
-            html = f"""
-                <div style="color:{fg}; background: {box_bg}; border: 1px solid {box_border}; border-radius: 1opx; padding: 10px;">
-                    <div style="font-size: 13px; font-weight: 600; letter-spacing: 0.5px; color: {header_col}; margin-bottom: 2px;">
-                        Project Summary
-                    </div>
-                    <div style="height: 1px; background: {line_col}; margin-bottom: 6px;"></div>
-
-                    <table style="border-collapse: collapse; margin: 4px 0 8px 0; font-size: 16px; color: {fg};">
-                        <tr>
-                            <th align="left" style="padding: 4px 18px 4px 0; color: {muted};">Units</th>
-                            <td style="padding: 4px 0;">{units}</td>
-                        </tr>
-                        <tr>
-                            <th align="left" style="padding: 4px 18px 4px 0; color: {muted};">Pile</th>
-                            <td style="padding: 4px 0;">{pile_text}</td>
-                        </tr>
-                        <tr>
-                            <th align="left" style="padding: 4px 18px 4px 0; color: {muted};">Loads</th>
-                            <td style="padding: 4px 0;">{loads_text}</td>
-                        </tr>
-                        <tr>
-                            <th align="left" style="padding: 4px 18px 4px 0; color: {muted};">Soil Layers</th>
-                            <td style="padding: 4px 0;">{len(layers)} defined</td>
-                        </tr>
-                    </table>
-
-                    {layers_section}
-
-                    <p style="margin-top: 6px; color: {tip}; font-size: 16px;">
-                        Tip: Use the Edit Controls to update inputs.
-                        Drag &amp; drop a <code>.pile.json</code> file anywhere to open an existing project.
-                    </p>
-                </div>"""
-
-            self.info.setHtml(html)
+            # setHtml re-lays out the whole browser, so only rebuild when an input changed
+            summary_key = (
+                units, getattr(self, "_current_theme", "light"),
+                tuple(pile.items()), tuple(loads.items()), _profile_key(layers),
+            )
+            if summary_key != self._summary_key:
+                self._summary_key = summary_key
+                # Inputs the summary does not display (e.g. extra pile fields) give identical HTML
+                html = self._summary_html(units, pile, loads, layers)
+                if html != self._last_html:
+                    self._last_html = html
+                    self.info.setHtml(html)
             self.btn_gen.setEnabled(True)
             self._update_status_bar()
             self._rebuild_layers_list()
 
-            if getattr(self, "_dock3d", None) and self._dock3d.isVisible():
+            # Only pile, soil and lateral-result changes affect the 3D scene
+            if getattr(self, "_dock3d", None) and self._dock3d.isVisible() and self._3d_dirty:
                 try:
                     self._refresh_3d_view()
                 except Exception as e:
-                    print("[3D] refresh_ui -> _refresh_3d_view_error:", e)
-
-  def _init_theme(self):
-    s = QSettings("Pile Analysis", "StudentEdition")
-    theme = s.value("theme", "light")
-    self._current_theme = theme
-    self._apply_theme(theme)
-    self._sync_theme_checks()
-
-  def set_theme(self, theme: str):
-    if theme not in ("light", "dark"):
-      theme = "light"
-    self._current_theme = theme
-    self._apply_theme(theme)
-    QSettings("Pile Analysis", "StudentEdition").setValue("theme", theme)
-    self._sync_theme_checks()
-    self.refresh_ui()
-    
-  def toggle_theme(self):
-    self.set_theme("dark" if getattr(self, "_current_theme", "light") != "dark" else "light")
+                    log.warning("[3D] refresh_ui -> _refresh_3d_view error: %s", e)
 
-  def _sync_theme_checks(self):
-    if hasattr(self, "actLight"):
-      self.actLight.setChecked(getattr(self, "_current_theme", "light") == "light")
-    if hasattr(self, "actDark"):
-      self.actDark.setChecked(getattr(self, "_current_theme", "light") == "dark")
-      
-  def _apply_theme(self, theme: str):
-    app = QApplication.instance()
-    if not app:
-      return
-    
-    if theme == "dark":
-      app.setStyleSheet("""
+  _DARK_QSS = """
         /* Base */
         QWidget {background: #2f3340; color:#e9edf5;}
         QToolTip { color: #e9edf5; background:#3a3f4e; border: 1px solid #596073;}
@@ -2216,7 +2622,48 @@ class MainWindow(QMainWindow):
         /* Links & selection */
         a, QLabel[foregroundRole="link"] {color: #8f4bff;}
         *::selection {background: #58627a; color: #ffffff;}
-        """)
+        """
+
+  def _init_theme(self):
+    theme = self._settings.value("theme", "light")
+    self._current_theme = theme
+    # Plot styling does not follow the Qt theme, so it is set up here rather than per theme change
+    _apply_mpl_light()
+    self._apply_theme(theme)
+    self._sync_theme_checks()
+
+  def set_theme(self, theme: str):
+    if theme not in ("light", "dark"):
+      theme = "light"
+    if theme == getattr(self, "_applied_theme", None):
+      # Re-selecting the active theme: nothing to restyle, persist or re-render
+      self._sync_theme_checks()
+      return
+    self._current_theme = theme
+    self._apply_theme(theme)
+    self._settings.setValue("theme", theme)
+    self._sync_theme_checks()
+    self.refresh_ui()
+    
+  def toggle_theme(self):
+    self.set_theme("dark" if getattr(self, "_current_theme", "light") != "dark" else "light")
+
+  def _sync_theme_checks(self):
+    theme = getattr(self, "_current_theme", "light")
+    _set_checked_quiet(self.actLight, theme == "light")
+    _set_checked_quiet(self.actDark, theme == "dark")
+      
+  def _apply_theme(self, theme: str):
+    app = QApplication.instance()
+    if not app:
+      return
+    # setStyleSheet re-parses and re-polishes every widget; skip it when nothing changed
+    if theme == getattr(self, "_applied_theme", None):
+      return
+    self._applied_theme = theme
+    
+    if theme == "dark":
+      app.setStyleSheet(self._DARK_QSS)
     else:
       app.setStyleSheet("")
 
@@ -2237,18 +2684,3 @@ class MainWindow(QMainWindow):
             "axes.grid": True,
     
     })"""
-    
-    # Matplotlib always light
-    mpl.rcParams.update(mpl.rcParamsDefault)
-    mpl.style.use("default")
-    mpl.rcParams.update({
-        "figure.facecolor": "white",
-        "axes.facecolor": "white",
-        "savefig.facecolor": "white",
-        "axes.edgecolor": "black",
-        "axes.labelcolor": "black",
-        "xtick.color": "black",
-        "ytick.color": "black",
-        "grid.color": "#CCCCCC",
-        "axes.grid": True,
-    })
\ No newline at end of file